@@ -0,0 +1,121 @@
+"""Benchmark pipeline model construction and BlogPost serialization paths.
+
+Columns compare building the nested models with validation (instances passed
+through) against ``model_construct``, ``model_dump_json`` against the
+shared-profile ``BlogPost.to_json_bytes``, and ``model_validate_json`` against
+``BlogPost.from_json_bytes``.
+
+    python benchmarks/model_serialization.py --sizes 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import time
+from typing import Callable, List
+
+from codex_fantasy_blogger.models import (
+    BlogPost,
+    NewsItem,
+    PlayerEvaluation,
+    PlayerProfile,
+    PlayerResearch,
+    TransactionDecision,
+)
+
+
+HEADLINES_PER_PLAYER = 3
+
+
+def _best_of(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _build(size: int, construct: bool) -> BlogPost:
+    make = (lambda cls, **kw: cls.model_construct(**kw)) if construct else (lambda cls, **kw: cls(**kw))
+    now = datetime.now(timezone.utc)
+    evaluations: List[PlayerEvaluation] = []
+    for index in range(size):
+        profile = PlayerProfile(
+            player_id=str(index),
+            name=f"Player {index}",
+            position="WR",
+            team="DAL",
+            espn_id=index,
+            trending_count=size - index,
+            metadata={"years_exp": index % 10, "age": 22 + index % 12},
+        )
+        headlines = [
+            NewsItem(
+                source="ESPN",
+                title=f"Player {index} headline {n}",
+                link=f"https://example.com/{index}/{n}",
+                published=now - timedelta(hours=n),
+                summary="Expanded role expected after the starter's injury.",
+            )
+            for n in range(HEADLINES_PER_PLAYER)
+        ]
+        research = make(
+            PlayerResearch,
+            player=profile,
+            headlines=headlines,
+            context_points=[f"Trending adds this week: {size - index:,}"],
+            summary="Top notes for the player.",
+        )
+        decision = TransactionDecision(
+            player=profile, recommendation="buy", confidence=0.7, rationale="Volume is trending up."
+        )
+        evaluations.append(make(PlayerEvaluation, research=research, decision=decision))
+    return make(
+        BlogPost,
+        title="FAAB Top Adds",
+        slug="faab-top-adds-bench",
+        created_at=now,
+        intro="Intro",
+        evaluations=evaluations,
+        outro="Outro",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    columns = (
+        "build",
+        "construct",
+        "dump_json",
+        "to_json",
+        "validate",
+        "from_json",
+        "dump bytes",
+        "to_json bytes",
+    )
+    print(f"{'players':>8} " + " ".join(f"{name:>13}" for name in columns))
+    for size in args.sizes:
+        post = _build(size, construct=False)
+        dumped = post.model_dump_json().encode()
+        packed = post.to_json_bytes()
+        row = [
+            _best_of(lambda: _build(size, construct=False), args.repeat),
+            _best_of(lambda: _build(size, construct=True), args.repeat),
+            _best_of(post.model_dump_json, args.repeat),
+            _best_of(post.to_json_bytes, args.repeat),
+            _best_of(lambda: BlogPost.model_validate_json(dumped), args.repeat),
+            _best_of(lambda: BlogPost.from_json_bytes(packed), args.repeat),
+        ]
+        cells = [f"{value * 1000:>11.2f}ms" for value in row]
+        cells += [f"{len(dumped):>13,}", f"{len(packed):>13,}"]
+        print(f"{size:>8} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Benchmark serial vs thread vs process research/evaluation over synthetic slates.
+
+Network calls are replaced with canned RSS that is parsed by feedparser, so the
+measured work is the CPU-bound part of the research path (feed parsing, model
+construction, ranking and heuristic summaries). Use ``--latency-ms`` to add a
+simulated per-request delay and see where threads overtake processes.
+
+    python benchmarks/research_pool.py --sizes 10 100 300 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import logging
+import os
+import time
+from typing import List
+
+import feedparser
+
+from codex_fantasy_blogger.agents.player_research_agent import PlayerResearchAgent
+from codex_fantasy_blogger.agents.transaction_expert_agent import TransactionExpertAgent
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.models import NewsItem, PlayerProfile
+from codex_fantasy_blogger.services.llm import LLMClient
+from codex_fantasy_blogger.services.news_client import NewsClient
+from codex_fantasy_blogger.utils.profiling import StageProfiler
+
+
+LATENCY_ENV = "FAAB_BENCH_LATENCY_MS"
+
+
+def _canned_feed(profile: PlayerProfile, entries: int) -> str:
+    now = datetime.now(timezone.utc)
+    items = []
+    for index in range(entries):
+        published = format_datetime(now - timedelta(hours=index * 7))
+        items.append(
+            "<item>"
+            f"<title>{profile.name} {profile.team} practice report and depth chart note {index}</title>"
+            f"<link>https://example.com/{profile.player_id}/{index}</link>"
+            f"<pubDate>{published}</pubDate>"
+            f"<description>{profile.name} saw a larger workload and more snaps in week {index}."
+            " Coaches expect an expanded role with the starter questionable.</description>"
+            "<source url=\"https://example.com\">Example Sports</source>"
+            "</item>"
+        )
+    return f"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel>{''.join(items)}</channel></rss>"
+
+
+class OfflineNewsClient(NewsClient):
+    """NewsClient that parses a canned feed instead of calling ESPN/Google."""
+
+    def get_news_for_player(self, profile: PlayerProfile) -> List[NewsItem]:
+        latency = float(os.environ.get(LATENCY_ENV, "0")) / 1000.0
+        if latency:
+            time.sleep(latency)
+        feed = feedparser.parse(_canned_feed(profile, config.news.candidate_headlines))
+        items: List[NewsItem] = []
+        for entry in feed.entries:
+            items.append(
+                NewsItem(
+                    source=entry.get("source", {}).get("title", "Google News"),
+                    title=entry.get("title", ""),
+                    link=entry.get("link", ""),
+                    published=datetime(*entry.published_parsed[:6]),
+                    summary=entry.get("summary"),
+                )
+            )
+        return items
+
+
+class OfflineLLMClient(LLMClient):
+    """LLMClient pinned to the heuristic path regardless of OPENAI_API_KEY."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._client = None
+
+
+def _slate(size: int) -> List[PlayerProfile]:
+    return [
+        PlayerProfile(
+            player_id=str(index),
+            name=f"Player{index} Benchmark{index}",
+            position="RB",
+            team="WAS",
+            espn_id=None,
+            trending_count=1000 * (size - index),
+            injury_status="Questionable" if index % 5 == 0 else None,
+            depth_chart_order=index % 4 + 1,
+        )
+        for index in range(size)
+    ]
+
+
+def _time_run(
+    profiles: List[PlayerProfile], workers: int, executor: str, profiler: StageProfiler
+) -> float:
+    research_agent = PlayerResearchAgent(
+        news_client=OfflineNewsClient(), llm=OfflineLLMClient(), workers=workers, executor=executor
+    )
+    transaction_agent = TransactionExpertAgent(llm=OfflineLLMClient(), workers=workers, executor=executor)
+    label = f"{len(profiles)}-{executor if workers > 1 else 'serial'}"
+    start = time.perf_counter()
+    with profiler.stage(f"research-{label}"):
+        research = research_agent.run(profiles)
+    with profiler.stage(f"transactions-{label}"):
+        transaction_agent.run(research)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 300])
+    parser.add_argument("--workers", type=int, default=min(os.cpu_count() or 1, 8))
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--profile", metavar="DIR", help="Write per-stage cProfile/tracemalloc reports under DIR"
+    )
+    args = parser.parse_args()
+    os.environ[LATENCY_ENV] = str(args.latency_ms)
+    # Profiling inflates timings; use it to see where time goes, not for the table.
+    profiler = StageProfiler.for_new_run(args.profile) if args.profile else StageProfiler()
+
+    # Per-player INFO logging would dominate the timings.
+    logging.disable(logging.INFO)
+
+    print(f"workers={args.workers} latency={args.latency_ms}ms")
+    print(f"{'players':>8} {'serial':>9} {'threads':>9} {'processes':>10}  fastest")
+    crossover = None
+    for size in args.sizes:
+        profiles = _slate(size)
+        serial = _time_run(profiles, 1, "thread", profiler)
+        threads = _time_run(profiles, args.workers, "thread", profiler)
+        processes = _time_run(profiles, args.workers, "process", profiler)
+        timings = {"serial": serial, "threads": threads, "processes": processes}
+        fastest = min(timings, key=timings.get)
+        if crossover is None and processes < threads:
+            crossover = size
+        print(f"{size:>8} {serial:>8.3f}s {threads:>8.3f}s {processes:>9.3f}s  {fastest}")
+    if crossover is None:
+        print("Processes did not overtake threads at the sizes measured.")
+    else:
+        print(f"Processes overtake threads from ~{crossover} players.")
+    summary_path = profiler.close()
+    if summary_path:
+        print(f"Profiles written to {summary_path.parent}")
+
+
+if __name__ == "__main__":
+    main()
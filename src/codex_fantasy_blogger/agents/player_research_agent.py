@@ -2,28 +2,77 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter
 
 from codex_fantasy_blogger.agents.base import Agent
-from codex_fantasy_blogger.models import PlayerProfile, PlayerResearch
+from codex_fantasy_blogger.models import NewsItem, PlayerProfile, PlayerResearch
 from codex_fantasy_blogger.services.llm import LLMClient
 from codex_fantasy_blogger.services.news_client import NewsClient
+from codex_fantasy_blogger.services.prompts import UsageTracker
+from codex_fantasy_blogger.services.relevance import HeadlineRanker
+from codex_fantasy_blogger.services.sleeper_client import SleeperClient
+from codex_fantasy_blogger.utils.deadline import RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
+from codex_fantasy_blogger.utils.parallel import ShardedExecutor, worker_resource
 
 
 logger = get_logger("agent.research")
 
+_HEADLINES = TypeAdapter(List[NewsItem])
+
+
+def _fetch_shard(
+    news_client_cls: type[NewsClient], budget: RunBudget, profiles: List[PlayerProfile]
+) -> List[bytes]:
+    """Pool worker: fetch candidate headlines, returned as compact JSON per player."""
+    client = worker_resource(news_client_cls)
+    client.budget = budget
+    results: List[bytes] = []
+    for profile in profiles:
+        logger.info("Collecting headlines for %s", profile.name)
+        results.append(_HEADLINES.dump_json(client.get_news_for_player(profile)))
+    return results
+
+
+def _summarize_shard(
+    llm_cls: type[LLMClient], budget: RunBudget, items: List[Tuple[PlayerProfile, List[NewsItem]]]
+) -> List[Tuple[str, UsageTracker]]:
+    """Pool worker: summarize each player's ranked headlines, returning token usage too."""
+    llm = worker_resource(llm_cls)
+    llm.budget = budget
+    return [(llm.summarize_context(profile, headlines), llm.usage.drain()) for profile, headlines in items]
+
 
 class PlayerResearchAgent(Agent):
-    def __init__(self, news_client: NewsClient | None = None, llm: LLMClient | None = None) -> None:
+    def __init__(
+        self,
+        news_client: NewsClient | None = None,
+        llm: LLMClient | None = None,
+        sleeper_client: SleeperClient | None = None,
+        ranker: HeadlineRanker | None = None,
+        workers: int = 1,
+        executor: str = "process",
+    ) -> None:
         super().__init__("PlayerResearchAgent")
         self.news_client = news_client or NewsClient()
         self.llm = llm or LLMClient()
+        self.ranker = ranker or HeadlineRanker()
+        # Optional: when provided, headlines are linked to every slate player they mention.
+        self.sleeper_client = sleeper_client
+        # With workers > 1, each pool worker builds its own instance of the client
+        # classes above (they must be constructible without arguments).
+        self.workers = workers
+        self.executor = executor
 
     def _build_context_points(self, profile: PlayerProfile) -> List[str]:
-        points = [
-            f"Trending adds this week: {profile.trending_count:,}",
-        ]
+        change_flagged = profile.metadata.get("candidate_source") == "directory_change"
+        points = []
+        # Change-feed players are picked before their adds spike; 0 adds says nothing about them.
+        if profile.trending_count or not change_flagged:
+            points.append(f"Trending adds this week: {profile.trending_count:,}")
         if profile.injury_status:
             status_note = profile.injury_notes or "Monitor practice participation."
             points.append(f"Injury status: {profile.injury_status} — {status_note}")
@@ -32,19 +81,104 @@ class PlayerResearchAgent(Agent):
         years_exp = profile.metadata.get("years_exp")
         if years_exp is not None:
             points.append(f"Years of NFL experience: {years_exp}")
+        if change_flagged:
+            points.append("Early flag: recent injury/depth-chart/team change ahead of a spike in adds")
         return points
 
-    def run(self, profiles: List[PlayerProfile]) -> List[PlayerResearch]:
-        results: List[PlayerResearch] = []
+    def _link_mentions(
+        self, profiles: List[PlayerProfile], headlines_by_player: Dict[str, List[NewsItem]]
+    ) -> None:
+        """Attach each headline to every slate player it names, not just the one it was fetched for."""
+        if self.sleeper_client is None:
+            return
+        try:
+            name_index = self.sleeper_client.get_name_index()
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Player name index unavailable (%s); skipping headline linking", exc)
+            return
+        slate_ids = {profile.player_id for profile in profiles}
+        seen_links = {
+            player_id: {item.link for item in items} for player_id, items in headlines_by_player.items()
+        }
+        scanned: set[tuple[str, str]] = set()
+        linked = 0
         for profile in profiles:
-            logger.info("Collecting headlines for %s", profile.name)
-            headlines = self.news_client.get_news_for_player(profile)
-            summary = self.llm.summarize_context(profile, headlines)
+            for item in list(headlines_by_player[profile.player_id]):
+                key = (item.link, item.title)
+                if key in scanned:
+                    continue
+                scanned.add(key)
+                mentioned = name_index.find(f"{item.title}\n{item.summary or ''}") & slate_ids
+                for player_id in mentioned:
+                    if item.link in seen_links[player_id]:
+                        continue
+                    headlines_by_player[player_id].append(item)
+                    seen_links[player_id].add(item.link)
+                    linked += 1
+        if linked:
+            logger.info("Linked %s headlines to additional mentioned players", linked)
+
+    def _collect_headlines(
+        self, profiles: List[PlayerProfile], pool: Optional[ShardedExecutor]
+    ) -> Dict[str, List[NewsItem]]:
+        if pool is None:
+            headlines_by_player: Dict[str, List[NewsItem]] = {}
+            for profile in profiles:
+                logger.info("Collecting headlines for %s", profile.name)
+                headlines_by_player[profile.player_id] = self.news_client.get_news_for_player(profile)
+            return headlines_by_player
+        budget = self.news_client.budget
+        payloads = pool.map(partial(_fetch_shard, type(self.news_client), budget), profiles)
+        # Record degradations the workers hit on their copies of the budget.
+        budget.check("research")
+        return {
+            profile.player_id: _HEADLINES.validate_json(payload)
+            for profile, payload in zip(profiles, payloads)
+        }
+
+    def _summarize(
+        self,
+        profiles: Sequence[PlayerProfile],
+        headlines_by_player: Dict[str, List[NewsItem]],
+        pool: Optional[ShardedExecutor],
+    ) -> List[str]:
+        items = [(profile, headlines_by_player[profile.player_id]) for profile in profiles]
+        if pool is None:
+            return [self.llm.summarize_context(profile, headlines) for profile, headlines in items]
+        summaries = []
+        shard_fn = partial(_summarize_shard, type(self.llm), self.llm.budget)
+        for summary, usage in pool.map(shard_fn, items):
+            self.llm.usage.merge(usage)
+            summaries.append(summary)
+        return summaries
+
+    def _research(
+        self, profiles: List[PlayerProfile], pool: Optional[ShardedExecutor]
+    ) -> List[PlayerResearch]:
+        headlines_by_player = self._collect_headlines(profiles, pool)
+        self._link_mentions(profiles, headlines_by_player)
+        headlines_by_player = self.ranker.rank(profiles, headlines_by_player)
+        summaries = self._summarize(profiles, headlines_by_player, pool)
+
+        results: List[PlayerResearch] = []
+        for profile, summary in zip(profiles, summaries):
             research = PlayerResearch(
                 player=profile,
-                headlines=headlines,
+                headlines=headlines_by_player[profile.player_id],
                 context_points=self._build_context_points(profile),
                 summary=summary,
             )
             results.append(research)
         return results
+
+    def run(self, profiles: List[PlayerProfile]) -> List[PlayerResearch]:
+        if self.workers > 1 and len(profiles) > 1:
+            logger.info(
+                "Sharding research for %s players across %s %s workers",
+                len(profiles),
+                self.workers,
+                self.executor,
+            )
+            with ShardedExecutor(self.workers, self.executor) as pool:
+                return self._research(profiles, pool)
+        return self._research(profiles, None)
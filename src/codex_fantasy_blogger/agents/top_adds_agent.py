@@ -5,8 +5,11 @@ from __future__ import annotations
 from typing import List
 
 from codex_fantasy_blogger.agents.base import Agent
-from codex_fantasy_blogger.models import PlayerProfile
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.models import PlayerProfile, PlayerTrend
+from codex_fantasy_blogger.services.directory_feed import DirectoryChangeFeed
 from codex_fantasy_blogger.services.sleeper_client import SleeperClient
+from codex_fantasy_blogger.services.trend_store import RANK_METRICS, TrendStore
 from codex_fantasy_blogger.utils.logging import get_logger
 
 
@@ -14,13 +17,82 @@ logger = get_logger("agent.top_adds")
 
 
 class TopAddsAgent(Agent):
-    def __init__(self, sleeper_client: SleeperClient | None = None, top_n: int = 10) -> None:
+    def __init__(
+        self,
+        sleeper_client: SleeperClient | None = None,
+        top_n: int = 10,
+        trend_store: TrendStore | None = None,
+        rank_by: str = "count",
+        change_feed: DirectoryChangeFeed | None = None,
+        change_slots: int = 0,
+    ) -> None:
         super().__init__("TopAddsAgent")
+        if rank_by not in RANK_METRICS:
+            raise ValueError(f"rank_by must be one of {RANK_METRICS}")
         self.sleeper_client = sleeper_client or SleeperClient()
         self.top_n = top_n
+        self.trend_store = trend_store or TrendStore()
+        self.rank_by = rank_by
+        # Up to change_slots of the top_n places go to players flagged by the directory
+        # change feed (injury/depth-chart/team moves) before their adds spike.
+        self.change_feed = change_feed
+        self.change_slots = min(change_slots, top_n)
+
+    def _change_candidates(
+        self, exclude: set[str], trends: List[PlayerTrend]
+    ) -> List[PlayerProfile]:
+        directory = self.sleeper_client.get_player_directory()
+        changes = self.change_feed.update(directory)
+        player_ids = [
+            player_id
+            for player_id in DirectoryChangeFeed.candidates(
+                changes, directory, self.change_slots + len(exclude)
+            )
+            if player_id not in exclude
+        ][: self.change_slots]
+        # Flagged players may already be trending below the top-N cut; keep their real count.
+        counts = {trend.player_id: trend.count for trend in trends}
+        profiles = self.sleeper_client.get_profiles_from_trends(
+            [PlayerTrend(player_id=player_id, count=counts.get(player_id, 0)) for player_id in player_ids],
+            len(player_ids),
+        )
+        for profile in profiles:
+            profile.metadata["candidate_source"] = "directory_change"
+            profile.metadata["directory_change"] = (
+                "added" if profile.player_id in changes.added else "changed"
+            )
+        return profiles
 
     def run(self) -> List[PlayerProfile]:
-        trends = self.sleeper_client.get_trending_adds(limit=self.top_n * 3)
-        profiles = self.sleeper_client.get_profiles_from_trends(trends, self.top_n)
+        depth = config.sleeper.max_trending
+        trends = self.sleeper_client.get_trending_adds(limit=max(self.top_n * 3, depth))
+        try:
+            # Snapshots are always recorded at the same depth so their cutoffs compare.
+            self.trend_store.append(trends[:depth], season_type=config.sleeper.season_type)
+        except OSError as exc:
+            logger.warning("Failed to record trending snapshot (%s)", exc)
+        candidates = trends
+        if self.rank_by == "count":
+            candidates = trends[: self.top_n * 3]
+        else:
+            # Fast risers can sit below the raw-count cut, so rank the whole fetched pool.
+            try:
+                candidates = self.trend_store.rank(
+                    trends, self.rank_by, season_type=config.sleeper.season_type
+                )
+            except OSError as exc:
+                logger.warning("Trend history unavailable (%s); ranking by raw counts", exc)
+        profiles = self.sleeper_client.get_profiles_from_trends(candidates, self.top_n)
+        if self.change_feed is not None:
+            try:
+                extras = self._change_candidates(
+                    {profile.player_id for profile in profiles}, trends
+                )
+            except OSError as exc:
+                logger.warning("Directory change feed unavailable (%s)", exc)
+                extras = []
+            if extras:
+                logger.info("Adding %s players from the directory change feed", len(extras))
+                profiles = profiles[: self.top_n - len(extras)] + extras
         logger.info("Selected top %s players for evaluation", len(profiles))
         return profiles
@@ -2,28 +2,67 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import partial
+from typing import List, Tuple
 
 from codex_fantasy_blogger.agents.base import Agent
-from codex_fantasy_blogger.models import PlayerEvaluation, PlayerResearch, TransactionDecision
+from codex_fantasy_blogger.models import (
+    PlayerEvaluation,
+    PlayerProfile,
+    PlayerResearch,
+    TransactionDecision,
+)
 from codex_fantasy_blogger.services.llm import LLMClient
+from codex_fantasy_blogger.services.prompts import UsageTracker
+from codex_fantasy_blogger.utils.deadline import RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
+from codex_fantasy_blogger.utils.parallel import ShardedExecutor, worker_resource
 
 
 logger = get_logger("agent.transaction")
 
 
+def _evaluate_shard(
+    llm_cls: type[LLMClient], budget: RunBudget, items: List[Tuple[PlayerProfile, str]]
+) -> List[Tuple[tuple[str, float, str], UsageTracker]]:
+    """Pool worker: evaluate each (player, summary) pair with a worker-local LLM client."""
+    llm = worker_resource(llm_cls)
+    llm.budget = budget
+    results = []
+    for player, summary in items:
+        logger.info("Evaluating transaction stance for %s", player.name)
+        results.append((llm.evaluate_player(player, summary), llm.usage.drain()))
+    return results
+
+
 class TransactionExpertAgent(Agent):
-    def __init__(self, llm: LLMClient | None = None) -> None:
+    def __init__(
+        self, llm: LLMClient | None = None, workers: int = 1, executor: str = "process"
+    ) -> None:
         super().__init__("TransactionExpertAgent")
         self.llm = llm or LLMClient()
+        self.workers = workers
+        self.executor = executor
+
+    def _decide(self, research_items: List[PlayerResearch]) -> List[tuple[str, float, str]]:
+        items = [(research.player, research.summary) for research in research_items]
+        if self.workers > 1 and len(items) > 1:
+            with ShardedExecutor(self.workers, self.executor) as pool:
+                results = pool.map(partial(_evaluate_shard, type(self.llm), self.llm.budget), items)
+            for _, usage in results:
+                self.llm.usage.merge(usage)
+            return [decision for decision, _ in results]
+        results = []
+        for player, summary in items:
+            logger.info("Evaluating transaction stance for %s", player.name)
+            results.append(self.llm.evaluate_player(player, summary))
+        return results
 
     def run(self, research_items: List[PlayerResearch]) -> List[PlayerEvaluation]:
         evaluations: List[PlayerEvaluation] = []
-        for research in research_items:
+        decisions = self._decide(research_items)
+        for research, (recommendation, confidence, rationale) in zip(research_items, decisions):
             player = research.player
-            logger.info("Evaluating transaction stance for %s", player.name)
-            recommendation, confidence, rationale = self.llm.evaluate_player(player, research.summary)
             decision = TransactionDecision(
                 player=player,
                 recommendation=recommendation,
@@ -13,6 +13,18 @@ from codex_fantasy_blogger.utils.logging import get_logger
 
 logger = get_logger("agent.writer")
 
+# Instructions stay in the static system prompts; only the date and players vary per run.
+INTRO_SYSTEM_PROMPT = (
+    "You are a fantasy football writer with a conversational tone. Write an energetic"
+    " 2-3 sentence introduction for a blog post summarizing this week's FAAB pickups."
+    " Mention the date and at least two of the key players you are given."
+)
+OUTRO_SYSTEM_PROMPT = (
+    "You are a seasoned fantasy football analyst. Write a short closing paragraph"
+    " (2 sentences) reminding readers to stay flexible with their FAAB bids and teasing"
+    " next week's update."
+)
+
 
 class WriterAgent(Agent):
     def __init__(self, llm: LLMClient | None = None) -> None:
@@ -28,13 +40,10 @@ class WriterAgent(Agent):
             f" Managers are flocking to {top_players} in most leagues right now."
         )
         return self.llm.draft_blog_section(
-            system_prompt="You are a fantasy football writer with a conversational tone.",
-            user_prompt=(
-                "Write an energetic 2-3 sentence introduction for a blog post summarizing"
-                " this week's FAAB pickups. Mention the date and at least two of the key"
-                f" players: {top_players}. Date: {date_str}."
-            ),
+            system_prompt=INTRO_SYSTEM_PROMPT,
+            user_prompt=f"Date: {date_str}\nKey players: {top_players}",
             fallback=fallback,
+            call_type="intro",
         )
 
     def _build_outro(self) -> str:
@@ -43,12 +52,10 @@ class WriterAgent(Agent):
             " We'll revisit these moves in next week's FAAB report."
         )
         return self.llm.draft_blog_section(
-            system_prompt="You are a seasoned fantasy football analyst.",
-            user_prompt=(
-                "Write a short closing paragraph (2 sentences) reminding readers to stay flexible"
-                " with their FAAB bids and teasing next week's update."
-            ),
+            system_prompt=OUTRO_SYSTEM_PROMPT,
+            user_prompt="Write the closing paragraph.",
             fallback=fallback,
+            call_type="outro",
         )
 
     def run(self, evaluations: List[PlayerEvaluation]) -> BlogPost:
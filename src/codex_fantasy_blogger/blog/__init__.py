@@ -1,5 +1,6 @@
 """Blog publishing helpers."""
 
 from .publisher import BlogPublisher
+from .search_index import SearchIndex
 
-__all__ = ["BlogPublisher"]
+__all__ = ["BlogPublisher", "SearchIndex"]
@@ -2,33 +2,65 @@
 
 from __future__ import annotations
 
+from datetime import datetime
+from functools import lru_cache, partial
 import json
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
+from codex_fantasy_blogger.blog.search_index import PREFIX_LENGTH, Posting, SearchIndex, post_terms
 from codex_fantasy_blogger.config import config
 from codex_fantasy_blogger.models import BlogPost
 from codex_fantasy_blogger.utils.logging import get_logger
+from codex_fantasy_blogger.utils.parallel import ShardedExecutor
 
 
 logger = get_logger("blog.publisher")
 
 
+@lru_cache(maxsize=None)
+def _worker_publisher(output_dir: str) -> "BlogPublisher":
+    return BlogPublisher(output_dir)
+
+
+_Rendered = Tuple[dict, Dict[str, Set[Posting]]]
+
+
+def _rerender_paths(publisher: "BlogPublisher", data_paths: List[str]) -> List[_Rendered]:
+    rendered = []
+    for data_path in data_paths:
+        post = BlogPost.from_json_bytes(Path(data_path).read_bytes())
+        rendered.append((publisher._write_post(post), post_terms(post)))
+    return rendered
+
+
+def _rerender_shard(output_dir: str, data_paths: List[str]) -> List[_Rendered]:
+    """Pool worker: re-render stored posts; returns their index entries and search terms."""
+    return _rerender_paths(_worker_publisher(output_dir), data_paths)
+
+
 class BlogPublisher:
     def __init__(self, output_dir: str | Path | None = None) -> None:
         self.output_dir = Path(output_dir or config.writer.output_dir)
         template_dir = Path(__file__).resolve().parent / "templates"
+        # Compiled templates are shared on disk, so re-render workers skip recompiling.
+        # Entries are keyed on the template source, so edits invalidate them.
+        cache_dir = config.writer.template_cache_dir
+        if cache_dir:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=False,
             lstrip_blocks=True,
+            bytecode_cache=FileSystemBytecodeCache(cache_dir),
         )
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_path = self.output_dir / "_posts.json"
         self.index_path = self.output_dir.parent / "index.html"
+        self.search_index = SearchIndex(self.output_dir.parent / "search")
 
     def _load_metadata(self) -> List[dict]:
         if not self.metadata_path.exists():
@@ -53,26 +85,119 @@ class BlogPublisher:
         return template.render(
             title=config.writer.blog_title,
             posts=posts_meta,
+            search_prefix_length=PREFIX_LENGTH,
         )
 
-    def publish(self, post: BlogPost) -> Path:
+    def data_path(self, slug: str) -> Path:
+        """Location of the structured post data stored next to the Markdown."""
+        return self.output_dir / f"{slug}.json"
+
+    def _write_post(self, post: BlogPost) -> dict:
+        """Render ``post`` to Markdown and return its index metadata entry."""
         post_path = self.output_dir / f"{post.slug}.md"
-        logger.info("Publishing blog post to %s", post_path)
         post_path.write_text(self._render_post(post))
-
-        metadata = self._load_metadata()
-        new_entry = {
+        return {
             "title": post.title,
             "slug": post.slug,
             "created_at": post.created_at.isoformat(),
             "path": str(post_path.relative_to(self.output_dir.parent)),
         }
-        filtered = [entry for entry in metadata if entry.get("slug") != post.slug]
-        filtered.append(new_entry)
-        filtered.sort(key=lambda item: item.get("created_at", ""), reverse=True)
-        self._save_metadata(filtered)
 
-        index_html = self._render_index(filtered)
+    def _update_index(self, entries: Iterable[dict]) -> List[dict]:
+        """Merge ``entries`` into the posts metadata and re-render the index once."""
+        updated: Dict[str, dict] = {entry["slug"]: entry for entry in entries}
+        metadata = [entry for entry in self._load_metadata() if entry.get("slug") not in updated]
+        metadata.extend(updated.values())
+        metadata.sort(key=lambda item: item.get("created_at", ""), reverse=True)
+        self._save_metadata(metadata)
+
+        index_html = self._render_index(metadata)
         logger.info("Updating index at %s", self.index_path)
         self.index_path.write_text(index_html)
+        return metadata
+
+    def _load_post(self, slug: str) -> Optional[BlogPost]:
+        data_path = self.data_path(slug)
+        if not data_path.exists():
+            return None
+        try:
+            return BlogPost.from_json_bytes(data_path.read_bytes())
+        except ValueError as exc:
+            logger.warning("Failed to read stored post %s (%s); not un-indexing it", data_path, exc)
+            return None
+
+    def publish(self, post: BlogPost) -> Path:
+        post_path = self.output_dir / f"{post.slug}.md"
+        logger.info("Publishing blog post to %s", post_path)
+        # A same-day re-run replaces the earlier post, so its postings are dropped from the index.
+        previous = self._load_post(post.slug)
+        entry = self._write_post(post)
+        self.data_path(post.slug).write_bytes(post.to_json_bytes())
+        self.search_index.replace_posts([post], {post.slug: previous} if previous else None)
+        self._update_index([entry])
         return post_path
+
+    @staticmethod
+    def _stored_created_at(data_path: Path) -> Optional[str]:
+        """``created_at`` read from a post data file that has no index metadata entry."""
+        try:
+            created_at = json.loads(data_path.read_bytes()).get("created_at")
+        except (OSError, ValueError, AttributeError) as exc:
+            logger.warning("Skipping unreadable post data %s (%s)", data_path, exc)
+            return None
+        if not isinstance(created_at, str):
+            logger.warning("Skipping post data %s without a creation date", data_path)
+            return None
+        return created_at
+
+    def archived_data_paths(
+        self, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> List[Path]:
+        """Stored post data files, optionally limited to posts created in [since, until].
+
+        Creation dates come from the index metadata, or from the data file itself
+        for posts missing from it.
+        """
+        created = {
+            entry.get("slug"): entry.get("created_at", "") for entry in self._load_metadata()
+        }
+        paths = []
+        for path in sorted(self.output_dir.glob("*.json")):
+            if path.name.startswith("_"):
+                continue
+            created_at = created.get(path.stem)
+            if not created_at and (since or until):
+                created_at = self._stored_created_at(path)
+                if created_at is None:
+                    continue
+            if created_at and since and created_at < since.isoformat():
+                continue
+            if created_at and until and created_at > until.isoformat():
+                continue
+            paths.append(path)
+        return paths
+
+    def rerender(self, data_paths: List[Path], workers: int = 1) -> List[Path]:
+        """Re-render archived posts from their stored data and rebuild the index once.
+
+        Their search terms are merged into the search index, which backfills posts
+        published before it existed without rewriting shards that already hold them.
+        """
+        if not data_paths:
+            logger.info("No archived post data to re-render")
+            return []
+        logger.info("Re-rendering %s archived posts (workers=%s)", len(data_paths), workers)
+        paths = [str(path) for path in data_paths]
+        if workers > 1 and len(paths) > 1:
+            with ShardedExecutor(workers, "process") as pool:
+                rendered = pool.map(partial(_rerender_shard, str(self.output_dir)), paths)
+        else:
+            rendered = _rerender_paths(self, paths)
+        entries = [entry for entry, _ in rendered]
+        terms: Dict[str, Set[Posting]] = {}
+        for _, found in rendered:
+            for term, postings in found.items():
+                terms.setdefault(term, set()).update(postings)
+        self.search_index.update(terms)
+        self._update_index(entries)
+        return [self.output_dir.parent / entry["path"] for entry in entries]
@@ -0,0 +1,136 @@
+"""Static inverted search index over published posts, sharded by term prefix."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import json
+from pathlib import Path
+import re
+from typing import Dict, Iterable, List, Mapping, Set
+
+from codex_fantasy_blogger.models import BlogPost
+from codex_fantasy_blogger.services.name_index import normalize_tokens
+from codex_fantasy_blogger.services.relevance import TEAM_NAMES
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("blog.search_index")
+
+# Two characters gives at most 36**2 shards, each holding a handful of terms.
+PREFIX_LENGTH = 2
+_SHARD_UNSAFE = re.compile(r"[^a-z0-9]")
+
+# Postings are "<slug>/<player_id>" so a query like "warren buy" intersects per player, not per post.
+Posting = str
+
+
+def posting(slug: str, player_id: str) -> Posting:
+    return f"{slug}/{player_id}"
+
+
+def shard_key(term: str) -> str:
+    """Shard a term lives in: its first PREFIX_LENGTH characters, padded with '_'."""
+    return _SHARD_UNSAFE.sub("_", term[:PREFIX_LENGTH]).ljust(PREFIX_LENGTH, "_")
+
+
+def post_terms(post: BlogPost) -> Dict[str, Set[Posting]]:
+    """Map each search term in ``post`` to the postings (one per player) it matches.
+
+    Terms are the normalized tokens of the player name, the team abbreviation and
+    full club name, the position and the buy/pass recommendation.
+    """
+    terms: Dict[str, Set[Posting]] = defaultdict(set)
+    for evaluation in post.evaluations:
+        player = evaluation.decision.player
+        text = [player.name, player.position or "", evaluation.decision.recommendation]
+        if player.team:
+            text.extend([player.team, TEAM_NAMES.get(player.team.upper(), "")])
+        for term in normalize_tokens(" ".join(text)):
+            terms[term].add(posting(post.slug, player.player_id))
+    return dict(terms)
+
+
+class SearchIndex:
+    """Inverted index stored as ``<root>/<prefix>.json`` files of ``{term: [postings]}``.
+
+    Updates are applied per shard: only shards containing a term that gained or
+    lost a posting are read and rewritten, so publishing one post touches a few
+    dozen small files regardless of archive size. The browser tokenizes a query
+    the same way and fetches only the shards of its terms.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def shard_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _load_shard(self, key: str) -> Dict[str, List[Posting]]:
+        path = self.shard_path(key)
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text())
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse search shard %s; rebuilding it from this update", path)
+        return {}
+
+    def _save_shard(self, key: str, shard: Dict[str, List[Posting]]) -> None:
+        path = self.shard_path(key)
+        if not shard:
+            path.unlink(missing_ok=True)
+            return
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(shard, sort_keys=True, separators=(",", ":")))
+        tmp_path.replace(path)
+
+    def update(
+        self,
+        added: Mapping[str, Set[Posting]],
+        removed: Mapping[str, Set[Posting]] | None = None,
+    ) -> List[Path]:
+        """Apply posting removals then additions; returns the shard files rewritten.
+
+        Shards whose content ends up unchanged are not written.
+        """
+        removed = removed or {}
+        by_shard: Dict[str, Set[str]] = defaultdict(set)
+        for term in set(added) | set(removed):
+            by_shard[shard_key(term)].add(term)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        written = []
+        for key, terms in sorted(by_shard.items()):
+            shard = self._load_shard(key)
+            before = {term: list(shard.get(term, [])) for term in terms}
+            for term in terms:
+                postings = set(shard.get(term, [])) - removed.get(term, set())
+                postings |= added.get(term, set())
+                if postings:
+                    shard[term] = sorted(postings)
+                else:
+                    shard.pop(term, None)
+            if any(shard.get(term, []) != before[term] for term in terms):
+                self._save_shard(key, shard)
+                written.append(self.shard_path(key))
+        logger.info("Search index: rewrote %s of %s touched shards", len(written), len(by_shard))
+        return written
+
+    def replace_posts(
+        self, posts: Iterable[BlogPost], previous: Mapping[str, BlogPost] | None = None
+    ) -> List[Path]:
+        """Index ``posts``, dropping postings from their ``previous`` versions (keyed by slug)."""
+        previous = previous or {}
+        added: Dict[str, Set[Posting]] = defaultdict(set)
+        removed: Dict[str, Set[Posting]] = defaultdict(set)
+        for post in posts:
+            for term, postings in post_terms(post).items():
+                added[term] |= postings
+            old = previous.get(post.slug)
+            if old is not None:
+                for term, postings in post_terms(old).items():
+                    removed[term] |= postings
+        # A posting present in both versions is removed then re-added, leaving the shard unchanged.
+        return self.update(added, removed)
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import datetime, time
+from typing import Optional
+
 import typer
 
 from codex_fantasy_blogger.agents.top_adds_agent import TopAddsAgent
+from codex_fantasy_blogger.blog.publisher import BlogPublisher
+from codex_fantasy_blogger.config import config
 from codex_fantasy_blogger.orchestrator import FaabBlogOrchestrator
+from codex_fantasy_blogger.services.directory_feed import DirectoryChangeFeed
+from codex_fantasy_blogger.services.trend_store import RANK_METRICS
+from codex_fantasy_blogger.utils.deadline import RunBudget, parse_deadline
 from codex_fantasy_blogger.utils.logging import get_logger
+from codex_fantasy_blogger.utils.profiling import StageProfiler
 
 
 app = typer.Typer(help="Generate fantasy football FAAB blog posts")
@@ -16,14 +25,80 @@ logger = get_logger("cli")
 @app.command("generate")
 def generate(
     top_n: int = typer.Option(10, help="Number of players to include in the report"),
+    workers: int = typer.Option(
+        1, help="Worker processes for research and evaluation (useful for deep-league slates)"
+    ),
+    rank_by: str = typer.Option(
+        "count", help="Rank trending adds by raw 'count', 24h 'velocity' or 'acceleration'"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Write per-stage CPU and memory profiles to a run directory"
+    ),
+    change_slots: int = typer.Option(
+        0, help="Places reserved for players flagged by directory changes (injury/depth chart)"
+    ),
+    deadline: Optional[str] = typer.Option(
+        None,
+        help="Whole-run time budget as a duration (900, 15m, 1h) or local clock time (HH:MM);"
+        " the pipeline degrades to fit it",
+    ),
 ) -> None:
     """Run the full agentic workflow and publish the post."""
     if top_n <= 0:
         raise typer.BadParameter("top_n must be positive")
-    logger.info("Launching FAAB blogger pipeline (top_n=%s)", top_n)
-    orchestrator = FaabBlogOrchestrator(top_adds_agent=TopAddsAgent(top_n=top_n))
+    if workers <= 0:
+        raise typer.BadParameter("workers must be positive")
+    if change_slots < 0:
+        raise typer.BadParameter("change_slots cannot be negative")
+    if rank_by not in RANK_METRICS:
+        raise typer.BadParameter(f"rank_by must be one of {', '.join(RANK_METRICS)}")
+    budget = None
+    if deadline is not None:
+        try:
+            budget = RunBudget(parse_deadline(deadline))
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+    logger.info("Launching FAAB blogger pipeline (top_n=%s, workers=%s)", top_n, workers)
+    profiler = StageProfiler.for_new_run(config.history.profile_dir) if profile else None
+    orchestrator = FaabBlogOrchestrator(
+        top_adds_agent=TopAddsAgent(
+            top_n=top_n,
+            rank_by=rank_by,
+            change_feed=DirectoryChangeFeed() if change_slots else None,
+            change_slots=change_slots,
+        ),
+        workers=workers,
+        profiler=profiler,
+        budget=budget,
+    )
     post_path = orchestrator.run()
     typer.echo(f"Blog post generated -> {post_path}")
+    for entry in orchestrator.budget.degradations:
+        typer.echo(f"Degraded to meet deadline: {entry['step']} (from {entry['stage'] or 'start'})")
+
+
+@app.command("rerender")
+def rerender(
+    workers: int = typer.Option(1, help="Worker processes used to render posts"),
+    since: Optional[datetime] = typer.Option(
+        None, formats=["%Y-%m-%d"], help="Only posts created on or after this date"
+    ),
+    until: Optional[datetime] = typer.Option(
+        None, formats=["%Y-%m-%d"], help="Only posts created on or before this date"
+    ),
+) -> None:
+    """Re-render archived posts from their stored data (e.g. after a template change)."""
+    if workers <= 0:
+        raise typer.BadParameter("workers must be positive")
+    if until is not None:
+        until = datetime.combine(until.date(), time.max)
+    publisher = BlogPublisher()
+    data_paths = publisher.archived_data_paths(since=since, until=until)
+    rendered = publisher.rerender(data_paths, workers=workers)
+    typer.echo(f"Re-rendered {len(rendered)} posts -> {publisher.index_path}")
+
+
+app.command("backfill", help="Alias for 'rerender'.")(rerender)
 
 
 if __name__ == "__main__":
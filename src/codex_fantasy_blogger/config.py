@@ -20,6 +20,8 @@ class NewsConfig:
     espn_news_url: str = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/news"
     google_news_url: str = "https://news.google.com/rss/search"
     max_headlines: int = 3
+    candidate_headlines: int = 12
+    recency_half_life_hours: float = 72.0
 
 
 @dataclass(frozen=True)
@@ -28,6 +30,29 @@ class WriterConfig:
     output_dir: str = "content/posts"
     index_template: str = "blog/index.html.j2"
     post_template: str = "blog/post.md.j2"
+    # None uses Jinja's per-user temp directory.
+    template_cache_dir: Optional[str] = os.environ.get("FAAB_BLOGGER_TEMPLATE_CACHE")
+
+
+@dataclass(frozen=True)
+class HistoryConfig:
+    trend_store_dir: str = "data/trending"
+    directory_hashes_path: str = "data/directory/hashes.npz"
+    usage_dir: str = "data/usage"
+    headline_cache_dir: str = "data/headlines"
+    run_report_dir: str = "data/runs"
+    profile_dir: str = "profiles"
+
+
+@dataclass(frozen=True)
+class DeadlineConfig:
+    http_timeout: float = 10.0
+    llm_timeout: float = 30.0
+    min_timeout: float = 1.0
+    # Degradations apply once the remaining share of a --deadline budget drops below these.
+    skip_google_news_below: float = 0.5
+    heuristic_llm_below: float = 0.3
+    cached_headlines_below: float = 0.15
 
 
 @dataclass(frozen=True)
@@ -35,6 +60,7 @@ class LLMConfig:
     provider: str = os.environ.get("FAAB_BLOGGER_LLM", "openai")
     model: str = os.environ.get("FAAB_BLOGGER_MODEL", "gpt-4o-mini")
     temperature: float = float(os.environ.get("FAAB_BLOGGER_TEMPERATURE", "0.4"))
+    max_input_tokens: int = int(os.environ.get("FAAB_BLOGGER_MAX_INPUT_TOKENS", "1200"))
 
     @property
     def api_key(self) -> Optional[str]:
@@ -47,6 +73,8 @@ class AppConfig:
     news: NewsConfig = NewsConfig()
     writer: WriterConfig = WriterConfig()
     llm: LLMConfig = LLMConfig()
+    history: HistoryConfig = HistoryConfig()
+    deadline: DeadlineConfig = DeadlineConfig()
 
 
 config = AppConfig()
@@ -6,6 +6,11 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
+
+
+# Bump when the layout written by BlogPost.to_json_bytes changes.
+SERIALIZATION_VERSION = 1
 
 
 class PlayerTrend(BaseModel):
@@ -53,6 +58,31 @@ class PlayerEvaluation(BaseModel):
     decision: TransactionDecision
 
 
+class _EvaluationRecord(BaseModel):
+    """Storage form of a PlayerEvaluation that references its player by id."""
+
+    player_id: str
+    headlines: List[NewsItem]
+    context_points: List[str]
+    summary: str
+    recommendation: str
+    confidence: float = Field(ge=0.0, le=1.0)
+    rationale: str
+
+
+class _BlogPostRecord(BaseModel):
+    """Storage form of a BlogPost with each player profile stored once."""
+
+    version: int
+    title: str
+    slug: str
+    created_at: datetime
+    intro: str
+    outro: Optional[str] = None
+    players: List[PlayerProfile]
+    evaluations: List[_EvaluationRecord]
+
+
 class BlogPost(BaseModel):
     title: str
     slug: str
@@ -81,3 +111,72 @@ class BlogPost(BaseModel):
             ],
             "outro": self.outro,
         }
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON in a single pass, storing each player profile once."""
+        players: Dict[str, PlayerProfile] = {}
+        evaluations = []
+        for evaluation in self.evaluations:
+            research, decision = evaluation.research, evaluation.decision
+            players.setdefault(decision.player.player_id, decision.player)
+            evaluations.append(
+                {
+                    "player_id": decision.player.player_id,
+                    "headlines": research.headlines,
+                    "context_points": research.context_points,
+                    "summary": research.summary,
+                    "recommendation": decision.recommendation,
+                    "confidence": decision.confidence,
+                    "rationale": decision.rationale,
+                }
+            )
+        return to_json(
+            {
+                "version": SERIALIZATION_VERSION,
+                "title": self.title,
+                "slug": self.slug,
+                "created_at": self.created_at,
+                "intro": self.intro,
+                "outro": self.outro,
+                "players": list(players.values()),
+                "evaluations": evaluations,
+            }
+        )
+
+    @classmethod
+    def from_json_bytes(cls, payload: bytes | str) -> "BlogPost":
+        """Restore a post written by ``to_json_bytes``.
+
+        The payload is validated once, in pydantic-core, as a flat record. The
+        nested models are then assembled from those validated instances, which
+        pydantic passes through without copying or re-validating, so each player
+        has a single shared PlayerProfile.
+        """
+        record = _BlogPostRecord.model_validate_json(payload)
+        if record.version != SERIALIZATION_VERSION:
+            raise ValueError(f"Unsupported blog post serialization version: {record.version}")
+        players = {profile.player_id: profile for profile in record.players}
+        evaluations = []
+        for item in record.evaluations:
+            player = players[item.player_id]
+            research = PlayerResearch(
+                player=player,
+                headlines=item.headlines,
+                context_points=item.context_points,
+                summary=item.summary,
+            )
+            decision = TransactionDecision(
+                player=player,
+                recommendation=item.recommendation,
+                confidence=item.confidence,
+                rationale=item.rationale,
+            )
+            evaluations.append(PlayerEvaluation(research=research, decision=decision))
+        return cls(
+            title=record.title,
+            slug=record.slug,
+            created_at=record.created_at,
+            intro=record.intro,
+            evaluations=evaluations,
+            outro=record.outro,
+        )
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+from datetime import datetime
+import json
 from pathlib import Path
 
 from codex_fantasy_blogger.agents.player_research_agent import PlayerResearchAgent
@@ -9,7 +12,11 @@ from codex_fantasy_blogger.agents.top_adds_agent import TopAddsAgent
 from codex_fantasy_blogger.agents.transaction_expert_agent import TransactionExpertAgent
 from codex_fantasy_blogger.agents.writer_agent import WriterAgent
 from codex_fantasy_blogger.blog.publisher import BlogPublisher
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.services.prompts import UsageTracker
+from codex_fantasy_blogger.utils.deadline import RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
+from codex_fantasy_blogger.utils.profiling import StageProfiler
 
 
 logger = get_logger("orchestrator")
@@ -23,20 +30,106 @@ class FaabBlogOrchestrator:
         transaction_agent: TransactionExpertAgent | None = None,
         writer_agent: WriterAgent | None = None,
         publisher: BlogPublisher | None = None,
+        workers: int = 1,
+        profiler: StageProfiler | None = None,
+        budget: RunBudget | None = None,
     ) -> None:
         self.top_adds_agent = top_adds_agent or TopAddsAgent()
-        self.research_agent = research_agent or PlayerResearchAgent()
-        self.transaction_agent = transaction_agent or TransactionExpertAgent()
+        self.research_agent = research_agent or PlayerResearchAgent(
+            sleeper_client=self.top_adds_agent.sleeper_client,
+            workers=workers,
+        )
+        self.transaction_agent = transaction_agent or TransactionExpertAgent(workers=workers)
         self.writer_agent = writer_agent or WriterAgent()
         self.publisher = publisher or BlogPublisher()
+        self.profiler = profiler or StageProfiler()
+        self.budget = budget or RunBudget()
+        self._attach_budget()
+
+    def _attach_budget(self) -> None:
+        """Share the run budget with every client that makes HTTP or LLM calls."""
+        self.top_adds_agent.sleeper_client.budget = self.budget
+        self.research_agent.news_client.budget = self.budget
+        if self.research_agent.sleeper_client is not None:
+            self.research_agent.sleeper_client.budget = self.budget
+        for agent in (self.research_agent, self.transaction_agent, self.writer_agent):
+            agent.llm.budget = self.budget
+
+    def _stage(self, name: str) -> contextlib.AbstractContextManager:
+        self.budget.current_stage = name
+        self.budget.check()
+        return self.profiler.stage(name)
+
+    def _write_run_report(self, output_path: Path | None) -> Path | None:
+        """Record the time budget and any degradations applied for a --deadline run."""
+        if not self.budget.limited:
+            return None
+        self.budget.check("publish")
+        report = self.budget.report(str(output_path) if output_path else None)
+        report_dir = Path(config.history.run_report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        report_path = report_dir / datetime.utcnow().strftime("run-%Y%m%dT%H%M%S.json")
+        report_path.write_text(json.dumps(report, indent=2))
+        steps = ", ".join(entry["step"] for entry in self.budget.degradations) or "none"
+        logger.info(
+            "Run finished in %.1fs of a %.0fs budget (degradations: %s); report at %s",
+            report["elapsed_seconds"],
+            self.budget.seconds,
+            steps,
+            report_path,
+        )
+        return report_path
+
+    def _write_usage_report(self) -> Path | None:
+        """Combine token usage from every agent's LLM client into a per-run JSON report."""
+        usage = UsageTracker()
+        seen = set()
+        for agent in (self.research_agent, self.transaction_agent, self.writer_agent):
+            llm = getattr(agent, "llm", None)
+            if llm is None or id(llm) in seen:
+                continue
+            seen.add(id(llm))
+            usage.merge(llm.usage.drain())
+        if not usage.by_call_type:
+            return None
+        report = usage.report()
+        totals = report["totals"]
+        logger.info(
+            "LLM usage: %s calls, %s prompt tokens (%s cached, %s estimated), %s completion tokens",
+            totals["calls"],
+            totals["prompt_tokens"],
+            totals["cached_tokens"],
+            totals["estimated_prompt_tokens"],
+            totals["completion_tokens"],
+        )
+        usage_dir = Path(config.history.usage_dir)
+        usage_dir.mkdir(parents=True, exist_ok=True)
+        report_path = usage_dir / datetime.utcnow().strftime("usage-%Y%m%dT%H%M%S.json")
+        report_path.write_text(json.dumps(report, indent=2))
+        return report_path
 
     def run(self) -> Path:
         logger.info("Starting FAAB blog generation pipeline")
-        profiles = self.top_adds_agent.run()
-        logger.info("Researching context for %s players", len(profiles))
-        research = self.research_agent.run(profiles)
-        evaluations = self.transaction_agent.run(research)
-        post = self.writer_agent.run(evaluations)
-        output_path = self.publisher.publish(post)
+        output_path = None
+        try:
+            with self._stage("top_adds"):
+                profiles = self.top_adds_agent.run()
+            logger.info("Researching context for %s players", len(profiles))
+            with self._stage("research"):
+                research = self.research_agent.run(profiles)
+            with self._stage("transactions"):
+                evaluations = self.transaction_agent.run(research)
+            with self._stage("writer"):
+                post = self.writer_agent.run(evaluations)
+            with self._stage("publish"):
+                output_path = self.publisher.publish(post)
+        finally:
+            summary_path = self.profiler.close()
+            if summary_path:
+                logger.info("Profiling report written to %s", summary_path.parent)
+            usage_path = self._write_usage_report()
+            if usage_path:
+                logger.info("LLM usage report written to %s", usage_path)
+            self._write_run_report(output_path)
         logger.info("Pipeline completed successfully -> %s", output_path)
         return output_path
@@ -1,7 +1,8 @@
 """External service clients."""
 
 from .llm import LLMClient
+from .name_index import PlayerNameIndex
 from .news_client import NewsClient
 from .sleeper_client import SleeperClient
 
-__all__ = ["LLMClient", "NewsClient", "SleeperClient"]
+__all__ = ["LLMClient", "NewsClient", "PlayerNameIndex", "SleeperClient"]
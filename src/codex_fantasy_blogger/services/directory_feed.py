@@ -0,0 +1,137 @@
+"""Change feed over successive Sleeper player directory snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Set
+
+import numpy as np
+
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("directory_feed")
+
+TRACKED_FIELDS = ("injury_status", "injury_notes", "depth_chart_order", "team", "news_updated")
+FANTASY_POSITIONS = {"QB", "RB", "WR", "TE"}
+_INACTIVE_STATUSES = {"Out", "IR", "PUP", "Sus", "NA"}
+# Players ranked above this are rostered nearly everywhere and are not waiver targets.
+_LIKELY_ROSTERED_RANK = 150
+_FIELD_SEPARATOR = "\x1f"
+
+
+def fingerprint(record: Mapping[str, object]) -> int:
+    """64-bit digest of the tracked fields of one directory record."""
+    text = _FIELD_SEPARATOR.join(str(record.get(name)) for name in TRACKED_FIELDS)
+    return int.from_bytes(blake2b(text.encode(), digest_size=8).digest(), "little")
+
+
+@dataclass
+class DirectoryChanges:
+    changed: Set[str] = field(default_factory=set)
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    baseline: bool = False
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.added) + len(self.removed)
+
+
+class DirectoryChangeFeed:
+    """Detects players whose injury, depth-chart, team or news fields changed.
+
+    Only one 64-bit hash per player is kept between runs (an ``.npz`` of sorted
+    ids and hashes), so a diff is a single pass over the new directory with a
+    dictionary lookup per record rather than a deep comparison of ~10k dicts.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path or config.history.directory_hashes_path)
+
+    def _load(self) -> Optional[Dict[str, int]]:
+        if not self.path.exists():
+            return None
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                return dict(zip(data["ids"].tolist(), data["hashes"].tolist()))
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Failed to read directory hashes (%s); starting a new baseline", exc)
+            return None
+
+    def _save(self, hashes: Dict[str, int]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        ids = sorted(hashes)
+        tmp_path = self.path.with_name(f"{self.path.stem}.tmp.npz")
+        np.savez_compressed(
+            tmp_path,
+            ids=np.array(ids, dtype=str),
+            hashes=np.array([hashes[player_id] for player_id in ids], dtype=np.uint64),
+        )
+        tmp_path.replace(self.path)
+
+    def diff(
+        self, directory: Mapping[str, dict], previous: Optional[Dict[str, int]]
+    ) -> tuple[DirectoryChanges, Dict[str, int]]:
+        """Hash every record once and classify it against ``previous`` hashes."""
+        current: Dict[str, int] = {}
+        changes = DirectoryChanges(baseline=previous is None)
+        previous = previous or {}
+        for player_id, record in directory.items():
+            digest = fingerprint(record)
+            current[player_id] = digest
+            old = previous.get(player_id)
+            if old is None:
+                if not changes.baseline:
+                    changes.added.add(player_id)
+            elif old != digest:
+                changes.changed.add(player_id)
+        if not changes.baseline:
+            changes.removed = set(previous) - set(current)
+        return changes, current
+
+    def update(self, directory: Mapping[str, dict]) -> DirectoryChanges:
+        """Diff ``directory`` against the stored hashes, then store its hashes."""
+        changes, current = self.diff(directory, self._load())
+        self._save(current)
+        if changes.baseline:
+            logger.info("Recorded directory baseline for %s players", len(current))
+        else:
+            logger.info(
+                "Directory changes: %s changed, %s added, %s removed",
+                len(changes.changed),
+                len(changes.added),
+                len(changes.removed),
+            )
+        return changes
+
+    @staticmethod
+    def candidates(
+        changes: DirectoryChanges, directory: Mapping[str, dict], limit: int
+    ) -> List[str]:
+        """Changed or added fantasy-relevant players likely to be in line for a bigger role.
+
+        Keeps skill-position players on a team, near the top of the depth chart,
+        not ruled out and outside the most-rostered tier, ordered by depth chart
+        order then Sleeper search rank.
+        """
+        picks = []
+        for player_id in changes.changed | changes.added:
+            record = directory.get(player_id) or {}
+            depth = record.get("depth_chart_order")
+            search_rank = record.get("search_rank")
+            search_rank = search_rank if isinstance(search_rank, int) else 10**9
+            if (
+                record.get("position") not in FANTASY_POSITIONS
+                or not record.get("team")
+                or not isinstance(depth, int)
+                or depth > 2
+                or record.get("injury_status") in _INACTIVE_STATUSES
+                or search_rank <= _LIKELY_ROSTERED_RANK
+            ):
+                continue
+            picks.append((depth, search_rank, player_id))
+        picks.sort()
+        return [player_id for _, _, player_id in picks[:limit]]
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import List, Optional
+import json
+from typing import Any, List, Optional
 
 from codex_fantasy_blogger.config import config
 from codex_fantasy_blogger.models import NewsItem, PlayerProfile
+from codex_fantasy_blogger.services.prompts import Prompt, PromptBuilder, UsageTracker
+from codex_fantasy_blogger.utils.deadline import HEURISTIC_LLM, RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
 
 try:
@@ -16,10 +19,43 @@ except ImportError:  # pragma: no cover
 
 logger = get_logger("llm")
 
+# System prompts hold every static instruction so requests of one call type share
+# an identical prefix; the per-player details follow in the user message.
+SUMMARY_SYSTEM_PROMPT = (
+    "You are a fantasy football analyst. Summarize why a player is trending on the waiver wire."
+    " You will receive a player card followed by recent headlines, most relevant first."
+    " Provide a concise summary (2 sentences)."
+)
+DECISION_SYSTEM_PROMPT = (
+    "You are an expert on fantasy football transactions."
+    " Evaluate waiver wire adds, output 'buy' to recommend spending FAAB or 'pass' otherwise."
+    " You will receive a player card followed by a research summary."
+    " Respond with JSON containing recommendation ('buy' or 'pass'),"
+    " confidence (0-1), and rationale (<=70 words)."
+)
+
+
+# Reserved-slot players flagged by the directory change feed before their adds spike.
+_CHANGE_SOURCE = "directory_change"
+# Heuristic buy score for a flagged player by depth chart order (starter, primary backup).
+_CHANGE_DEPTH_SCORES = {1: 0.7, 2: 0.55}
+
+
+def _trend_line(player: PlayerProfile) -> str:
+    if player.metadata.get("candidate_source") == _CHANGE_SOURCE and not player.trending_count:
+        return (
+            "Trending adds: not trending yet (flagged early by an injury/depth-chart/team"
+            " change in the Sleeper directory)"
+        )
+    return f"Trending adds: {player.trending_count}"
+
 
 class LLMClient:
-    def __init__(self) -> None:
+    def __init__(self, budget: RunBudget | None = None) -> None:
         self._client = None
+        self.prompts = PromptBuilder()
+        self.usage = UsageTracker()
+        self.budget = budget or RunBudget()
         if OpenAI and config.llm.api_key:
             try:
                 self._client = OpenAI(api_key=config.llm.api_key)
@@ -35,58 +71,56 @@ class LLMClient:
     def is_available(self) -> bool:
         return self._client is not None
 
+    def _use_llm(self) -> bool:
+        """Whether to call the model now; False also once the run budget forces heuristics."""
+        if not self.is_available:
+            return False
+        self.budget.check()
+        return not self.budget.is_degraded(HEURISTIC_LLM)
+
     def _render_headline_bullets(self, headlines: List[NewsItem]) -> str:
         bullets = []
         for item in headlines:
             bullets.append(f"- {item.title} ({item.source})")
         return "\n".join(bullets)
 
-    def draft_blog_section(self, system_prompt: str, user_prompt: str, fallback: str) -> str:
-        if not self.is_available:
+    def _complete(self, call_type: str, prompt: Prompt, **kwargs: Any) -> str:
+        response = self._client.responses.create(
+            model=config.llm.model,
+            temperature=config.llm.temperature,
+            input=prompt.messages,
+            timeout=self.budget.timeout(config.deadline.llm_timeout),
+            **kwargs,
+        )
+        self.usage.record(call_type, prompt.input_tokens, response)
+        return response.output[0].content[0].text
+
+    def draft_blog_section(
+        self, system_prompt: str, user_prompt: str, fallback: str, call_type: str = "blog_section"
+    ) -> str:
+        if not self._use_llm():
             return fallback
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
         try:
-            response = self._client.responses.create(
-                model=config.llm.model,
-                temperature=config.llm.temperature,
-                input=messages,
-            )
-            return response.output[0].content[0].text.strip()
+            prompt = self.prompts.build(system_prompt, user_prompt)
+            return self._complete(call_type, prompt).strip()
         except Exception as exc:  # noqa: BLE001
             logger.warning("LLM blog section draft failed (%s); using fallback", exc)
             return fallback
 
     def summarize_context(self, player: PlayerProfile, headlines: List[NewsItem]) -> str:
-        if not self.is_available:
+        if not self._use_llm():
             return self._heuristic_summary(player, headlines)
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are a fantasy football analyst. Summarize why a player is trending on the waiver wire."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Player: {player.name} ({player.position or 'N/A'} - {player.team or 'FA'})\n"
-                    f"Trending adds: {player.trending_count}\n"
-                    f"Injury status: {player.injury_status or 'None'}\n"
-                    f"Headlines:\n{self._render_headline_bullets(headlines)}\n"
-                    "Provide a concise summary (2 sentences)."
-                ),
-            },
-        ]
+        prompt = self.prompts.build(
+            SUMMARY_SYSTEM_PROMPT,
+            (
+                f"Player: {player.name} ({player.position or 'N/A'} - {player.team or 'FA'})\n"
+                f"{_trend_line(player)}\n"
+                f"Injury status: {player.injury_status or 'None'}"
+            ),
+            headlines=headlines,
+        )
         try:
-            response = self._client.responses.create(
-                model=config.llm.model,
-                temperature=config.llm.temperature,
-                input=messages,
-            )
-            return response.output[0].content[0].text.strip()
+            return self._complete("summary", prompt).strip()
         except Exception as exc:  # noqa: BLE001
             logger.warning(
                 "LLM summarization failed for %s (%s); using heuristic fallback",
@@ -107,7 +141,34 @@ class LLMClient:
             )
         return "\n".join(pieces).strip()
 
+    def _heuristic_change_decision(
+        self, player: PlayerProfile, summary: str
+    ) -> tuple[str, float, str]:
+        """Score a change-feed player on role and change type, since adds have not spiked yet."""
+        depth = player.depth_chart_order
+        change = player.metadata.get("directory_change", "changed")
+        score = _CHANGE_DEPTH_SCORES.get(depth, 0.4)
+        rationale_parts = [
+            summary,
+            f"Flagged early: Sleeper directory entry {change}, depth chart order {depth or 'unknown'}.",
+        ]
+        if change == "added":
+            # New entries are usually signings or practice-squad elevations with an unclear role.
+            score -= 0.05
+        if player.injury_status in {"Doubtful", "Questionable"}:
+            score *= 0.6 if player.injury_status == "Doubtful" else 0.85
+            rationale_parts.append(f"Tempered by injury status ({player.injury_status}).")
+        # Already-rising adds only ever raise the score.
+        score = max(score, min(player.trending_count / 150000, 1.0))
+        recommendation = "buy" if score >= 0.5 else "pass"
+        confidence = round(score if recommendation == "buy" else 1 - score, 2)
+        if recommendation == "buy":
+            rationale_parts.append("Adds have not spiked yet, so a modest bid can land the player early.")
+        return recommendation, confidence, " ".join(rationale_parts).strip()
+
     def _heuristic_decision(self, player: PlayerProfile, summary: str) -> tuple[str, float, str]:
+        if player.metadata.get("candidate_source") == _CHANGE_SOURCE:
+            return self._heuristic_change_decision(player, summary)
         rationale_parts = [summary]
         score = min(player.trending_count / 150000, 1.0)
         if player.injury_status and player.injury_status not in {"Questionable", "None", "Healthy"}:
@@ -127,40 +188,21 @@ class LLMClient:
         return recommendation, confidence, " ".join(rationale_parts).strip()
 
     def evaluate_player(self, player: PlayerProfile, summary: str) -> tuple[str, float, str]:
-        if not self.is_available:
+        if not self._use_llm():
             return self._heuristic_decision(player, summary)
-        messages = [
-            {
-                "role": "system",
-                "content": (
-                    "You are an expert on fantasy football transactions."
-                    " Evaluate waiver wire adds, output 'buy' to recommend spending FAAB or 'pass' otherwise."
-                ),
-            },
-            {
-                "role": "user",
-                "content": (
-                    f"Player: {player.name}\n"
-                    f"Position: {player.position}\n"
-                    f"Team: {player.team}\n"
-                    f"Trending adds: {player.trending_count}\n"
-                    f"Injury status: {player.injury_status or 'None'}\n"
-                    f"Summary: {summary}\n"
-                    "Respond with JSON containing recommendation ('buy' or 'pass'),"
-                    " confidence (0-1), and rationale (<=70 words)."
-                ),
-            },
-        ]
+        prompt = self.prompts.build(
+            DECISION_SYSTEM_PROMPT,
+            (
+                f"Player: {player.name}\n"
+                f"Position: {player.position}\n"
+                f"Team: {player.team}\n"
+                f"{_trend_line(player)}\n"
+                f"Injury status: {player.injury_status or 'None'}\n"
+                f"Summary: {summary}"
+            ),
+        )
         try:
-            response = self._client.responses.create(
-                model=config.llm.model,
-                temperature=config.llm.temperature,
-                input=messages,
-                response_format={"type": "json_object"},
-            )
-            payload = response.output[0].content[0].text
-            import json
-
+            payload = self._complete("decision", prompt, response_format={"type": "json_object"})
             data = json.loads(payload)
             recommendation = data.get("recommendation", "pass").lower()
             confidence = float(data.get("confidence", 0.5))
@@ -0,0 +1,121 @@
+"""Precomputed player-name matching over free text."""
+
+from __future__ import annotations
+
+from collections import deque
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
+
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("name_index")
+
+_STRIP_CHARS = re.compile(r"[.'’`]")
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """Lower-case, strip accents and punctuation, and split text into word tokens.
+
+    Periods and apostrophes are removed rather than split on so that "A.J." and
+    "D'Andre" match "AJ" and "DAndre"; hyphens split, so "Croskey-Merritt" and
+    "Croskey Merritt" are equivalent.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii").lower()
+    return _NON_WORD.sub(" ", _STRIP_CHARS.sub("", ascii_text)).split()
+
+
+def name_forms(record: Mapping[str, object]) -> Set[Tuple[str, ...]]:
+    """Return the token sequences a directory record is commonly referred to by."""
+    forms: Set[Tuple[str, ...]] = set()
+    full_name = record.get("full_name")
+    if not isinstance(full_name, str) or not full_name:
+        return forms
+    full = normalize_tokens(full_name)
+    forms.add(tuple(full))
+    while full and full[-1] in _NAME_SUFFIXES:
+        full = full[:-1]
+    forms.add(tuple(full))
+    first, last = record.get("first_name"), record.get("last_name")
+    if isinstance(first, str) and isinstance(last, str):
+        last_tokens = [token for token in normalize_tokens(last) if token not in _NAME_SUFFIXES]
+        forms.add(tuple(normalize_tokens(first) + last_tokens))
+    # A lone token ("Brown") is far too ambiguous to link a headline on.
+    return {form for form in forms if len(form) >= 2}
+
+
+class PlayerNameIndex:
+    """Token-level Aho-Corasick automaton mapping player names to player ids.
+
+    Built once from the Sleeper directory, it finds every known name in a piece
+    of text in a single pass, independent of how many names are indexed.
+    """
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Set[str]] = [set()]
+        self._built = False
+
+    @classmethod
+    def from_directory(cls, directory: Mapping[str, dict]) -> "PlayerNameIndex":
+        index = cls()
+        for player_id, record in directory.items():
+            if not isinstance(record, Mapping):
+                continue
+            for form in name_forms(record):
+                index.add(form, player_id)
+        index.build()
+        logger.info("Built player name index (%s nodes, %s players)", len(index), len(directory))
+        return index
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def add(self, tokens: Iterable[str], player_id: str) -> None:
+        if self._built:
+            raise RuntimeError("Cannot add names after the index has been built")
+        node = 0
+        for token in tokens:
+            nxt = self._goto[node].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][token] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(set())
+            node = nxt
+        if node:
+            self._out[node].add(player_id)
+
+    def build(self) -> None:
+        queue: deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] |= self._out[self._fail[child]]
+        self._built = True
+
+    def find(self, text: str) -> Set[str]:
+        """Return the ids of every player whose name appears in ``text``."""
+        if not self._built:
+            self.build()
+        matches: Set[str] = set()
+        node = 0
+        for token in normalize_tokens(text):
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            if self._out[node]:
+                matches |= self._out[node]
+        return matches
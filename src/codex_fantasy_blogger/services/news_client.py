@@ -3,30 +3,72 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional
 
 import feedparser
+from pydantic import TypeAdapter, ValidationError
 import requests
 
 from codex_fantasy_blogger.config import config
 from codex_fantasy_blogger.models import NewsItem, PlayerProfile
+from codex_fantasy_blogger.utils.deadline import CACHED_HEADLINES, SKIP_GOOGLE_NEWS, RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
 
 
 logger = get_logger("news")
 
+_HEADLINES = TypeAdapter(List[NewsItem])
+
 
 class NewsClient:
-    def __init__(self, session: Optional[requests.Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        budget: RunBudget | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         self.session = session or requests.Session()
+        self.budget = budget or RunBudget()
+        # Last successful fetch per player, served when the run budget runs out.
+        self.cache_dir = Path(cache_dir or config.history.headline_cache_dir)
+
+    def _timeout(self) -> float:
+        return self.budget.timeout(config.deadline.http_timeout)
+
+    def _cache_path(self, profile: PlayerProfile) -> Path:
+        return self.cache_dir / f"{profile.player_id}.json"
+
+    def _load_cached(self, profile: PlayerProfile) -> List[NewsItem]:
+        path = self._cache_path(profile)
+        if not path.exists():
+            logger.info("No cached headlines for %s", profile.name)
+            return []
+        try:
+            return _HEADLINES.validate_json(path.read_bytes())
+        except (OSError, ValidationError) as exc:
+            logger.warning("Failed to read cached headlines for %s (%s)", profile.name, exc)
+            return []
+
+    def _store_cached(self, profile: PlayerProfile, headlines: List[NewsItem]) -> None:
+        if not headlines:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._cache_path(profile)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(_HEADLINES.dump_json(headlines))
+            tmp_path.replace(path)
+        except OSError as exc:
+            logger.warning("Failed to cache headlines for %s (%s)", profile.name, exc)
 
     def _fetch_espn_headlines(self, espn_id: int) -> List[NewsItem]:
         params = {"athlete": espn_id}
-        resp = self.session.get(config.news.espn_news_url, params=params, timeout=10)
+        resp = self.session.get(config.news.espn_news_url, params=params, timeout=self._timeout())
         resp.raise_for_status()
         data = resp.json()
         items: List[NewsItem] = []
-        for article in data.get("articles", [])[: config.news.max_headlines]:
+        for article in data.get("articles", [])[: config.news.candidate_headlines]:
             published = article.get("published") or article.get("lastModified")
             published_dt = None
             if published:
@@ -51,9 +93,9 @@ class NewsClient:
         params = {"q": query, "hl": "en-US", "gl": "US", "ceid": "US:en"}
         url = config.news.google_news_url
         logger.debug("Querying Google News RSS for %s", query)
-        feed = feedparser.parse(self.session.get(url, params=params, timeout=10).text)
+        feed = feedparser.parse(self.session.get(url, params=params, timeout=self._timeout()).text)
         items: List[NewsItem] = []
-        for entry in feed.entries[: config.news.max_headlines]:
+        for entry in feed.entries[: config.news.candidate_headlines]:
             published_dt = None
             published = entry.get("published")
             if published:
@@ -74,19 +116,48 @@ class NewsClient:
         return items
 
     def get_news_for_player(self, profile: PlayerProfile) -> List[NewsItem]:
+        """Return a candidate pool of headlines; callers rank and trim it.
+
+        Successful fetches are cached per player. When the run budget is low,
+        Google News is skipped, and later only the cache is used.
+        """
+        self.budget.check("research")
+        if self.budget.is_degraded(CACHED_HEADLINES):
+            return self._load_cached(profile)
+        headlines = self._fetch_headlines(profile)
+        self._store_cached(profile, headlines)
+        return headlines
+
+    def _fetch_headlines(self, profile: PlayerProfile) -> List[NewsItem]:
+        headlines: List[NewsItem] = []
         if profile.espn_id:
             try:
                 headlines = self._fetch_espn_headlines(profile.espn_id)
-                if headlines:
+                if len(headlines) >= config.news.max_headlines:
                     return headlines
             except requests.HTTPError as exc:  # fallback on HTTP issues
                 logger.warning("ESPN headlines failed for %s (%s)", profile.name, exc)
             except requests.RequestException as exc:
                 logger.warning("ESPN request failed for %s (%s)", profile.name, exc)
+        if self.budget.is_degraded(SKIP_GOOGLE_NEWS):
+            if not headlines:
+                logger.warning("No ESPN headlines for %s; Google News skipped, using cache", profile.name)
+                return self._load_cached(profile)
+            return headlines
         query_parts = [profile.name]
         if profile.team:
             query_parts.append(profile.team)
         if profile.position:
             query_parts.append(profile.position)
         query = " ".join(query_parts)
-        return self._fetch_google_news(query)
+        try:
+            return headlines + self._fetch_google_news(query)
+        except requests.RequestException as exc:
+            # A slow or failing upstream degrades this player's research; it never aborts the run.
+            if not headlines:
+                logger.warning(
+                    "Google News request failed for %s (%s); using cached headlines", profile.name, exc
+                )
+                return self._load_cached(profile)
+            logger.warning("Google News request failed for %s (%s)", profile.name, exc)
+            return headlines
@@ -0,0 +1,143 @@
+"""Prompt construction with input-token budgeting and usage accounting."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.models import NewsItem
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:  # pragma: no cover
+    tiktoken = None
+
+
+# Chat formatting adds a few tokens per message on top of the content.
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _encoder() -> Optional[Any]:
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(config.llm.model)
+    except Exception:  # noqa: BLE001 - unknown model names or missing encoding files
+        return None
+
+
+@dataclass
+class Prompt:
+    messages: List[Dict[str, str]]
+    input_tokens: int
+
+
+class PromptBuilder:
+    """Builds prefix-stable messages that fit within an input-token budget.
+
+    The system message is static per call type, so every request of that type
+    starts with the same prefix and all per-player content goes in the final
+    user message. These prompts are far below the 1024-token minimum OpenAI
+    caches, so this layout does not produce cache hits. When that content would
+    exceed ``max_input_tokens``, headline summaries are dropped starting from the
+    lowest-priority headline, then whole headlines.
+    """
+
+    def __init__(self, max_input_tokens: int | None = None) -> None:
+        self.max_input_tokens = max_input_tokens or config.llm.max_input_tokens
+        self._encoding = _encoder()
+
+    def count_tokens(self, text: str) -> int:
+        if self._encoding is not None:
+            return len(self._encoding.encode(text))
+        # Roughly four characters per token for English prose.
+        return max(1, (len(text) + 3) // 4)
+
+    def _count_messages(self, messages: List[Dict[str, str]]) -> int:
+        return sum(self.count_tokens(m["content"]) + _MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+    @staticmethod
+    def _render_headline(item: NewsItem, with_summary: bool) -> str:
+        line = f"- {item.title} ({item.source})"
+        if with_summary and item.summary and item.summary != item.title:
+            line += f": {item.summary}"
+        return line
+
+    def build(
+        self, system: str, user: str, headlines: Optional[List[NewsItem]] = None
+    ) -> Prompt:
+        """Return messages for ``system`` + ``user`` with ``headlines`` (best first) appended."""
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": user}]
+        if not headlines:
+            return Prompt(messages, self._count_messages(messages))
+
+        base_tokens = self._count_messages(messages) + self.count_tokens("\nHeadlines:\n")
+        budget = self.max_input_tokens - base_tokens
+        lines = [self._render_headline(item, with_summary=True) for item in headlines]
+        costs = [self.count_tokens(line) + 1 for line in lines]
+        keep = len(lines)
+        summarized = len(lines)
+        # Strip summaries from the tail first, then drop whole headlines from the tail.
+        while sum(costs[:keep]) > budget and (summarized or keep):
+            if summarized:
+                summarized -= 1
+                lines[summarized] = self._render_headline(headlines[summarized], with_summary=False)
+                costs[summarized] = self.count_tokens(lines[summarized]) + 1
+            else:
+                keep -= 1
+        block = "\n".join(lines[:keep]) if keep else "- (headlines omitted to fit the input budget)"
+        messages[-1]["content"] = f"{user}\nHeadlines:\n{block}"
+        return Prompt(messages, self._count_messages(messages))
+
+
+@dataclass
+class UsageRecord:
+    calls: int = 0
+    estimated_prompt_tokens: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+
+    def add(self, other: "UsageRecord") -> None:
+        self.calls += other.calls
+        self.estimated_prompt_tokens += other.estimated_prompt_tokens
+        self.prompt_tokens += other.prompt_tokens
+        self.cached_tokens += other.cached_tokens
+        self.completion_tokens += other.completion_tokens
+
+
+@dataclass
+class UsageTracker:
+    """Token usage per LLM call type (summary, decision, blog_section, ...)."""
+
+    by_call_type: Dict[str, UsageRecord] = field(default_factory=dict)
+
+    def record(self, call_type: str, estimated_prompt_tokens: int, response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "input_tokens_details", None)
+        entry = self.by_call_type.setdefault(call_type, UsageRecord())
+        entry.calls += 1
+        entry.estimated_prompt_tokens += estimated_prompt_tokens
+        entry.prompt_tokens += getattr(usage, "input_tokens", 0) or 0
+        entry.cached_tokens += getattr(details, "cached_tokens", 0) or 0
+        entry.completion_tokens += getattr(usage, "output_tokens", 0) or 0
+
+    def merge(self, other: "UsageTracker") -> None:
+        for call_type, entry in other.by_call_type.items():
+            self.by_call_type.setdefault(call_type, UsageRecord()).add(entry)
+
+    def drain(self) -> "UsageTracker":
+        """Return the usage recorded so far and reset; used to ship usage out of pool workers."""
+        drained = UsageTracker(self.by_call_type)
+        self.by_call_type = {}
+        return drained
+
+    def report(self) -> Dict[str, Any]:
+        totals = UsageRecord()
+        for entry in self.by_call_type.values():
+            totals.add(entry)
+        return {
+            "by_call_type": {name: vars(entry) for name, entry in sorted(self.by_call_type.items())},
+            "totals": vars(totals),
+        }
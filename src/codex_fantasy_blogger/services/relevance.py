@@ -0,0 +1,214 @@
+"""Headline relevance ranking for the research stage."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+import zlib
+
+import numpy as np
+
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.models import NewsItem, PlayerProfile
+from codex_fantasy_blogger.services.name_index import normalize_tokens
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("relevance")
+
+# Headlines usually name the club rather than the abbreviation Sleeper stores.
+TEAM_NAMES: Dict[str, str] = {
+    "ARI": "arizona cardinals", "ATL": "atlanta falcons", "BAL": "baltimore ravens",
+    "BUF": "buffalo bills", "CAR": "carolina panthers", "CHI": "chicago bears",
+    "CIN": "cincinnati bengals", "CLE": "cleveland browns", "DAL": "dallas cowboys",
+    "DEN": "denver broncos", "DET": "detroit lions", "GB": "green bay packers",
+    "HOU": "houston texans", "IND": "indianapolis colts", "JAX": "jacksonville jaguars",
+    "KC": "kansas city chiefs", "LAC": "chargers", "LAR": "rams",
+    "LV": "las vegas raiders", "MIA": "miami dolphins", "MIN": "minnesota vikings",
+    "NE": "new england patriots", "NO": "new orleans saints", "NYG": "giants",
+    "NYJ": "jets", "PHI": "philadelphia eagles", "PIT": "pittsburgh steelers",
+    "SEA": "seattle seahawks", "SF": "san francisco 49ers", "TB": "tampa bay buccaneers",
+    "TEN": "tennessee titans", "WAS": "washington commanders",
+}
+
+_ROLE_TERMS = (
+    "injury injured questionable doubtful out ir inactive activated return returns"
+    " practice limited starter starting start depth chart promoted backup workload"
+    " role snaps targets carries lead bellcow breakout opportunity"
+).split()
+
+_NAME_WEIGHT = 3.0
+_TEAM_WEIGHT = 1.5
+_ROLE_WEIGHT = 1.0
+_RELEVANCE_WEIGHT = 0.7
+_RECENCY_WEIGHT = 0.3
+_UNDATED_RECENCY = 0.25
+
+_SHINGLE_SIZE = 3
+_MINHASH_PERMUTATIONS = 32
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def _document_tokens(item: NewsItem) -> List[str]:
+    return normalize_tokens(f"{item.title} {item.summary or ''}")
+
+
+def _query_terms(profile: PlayerProfile) -> List[Tuple[str, float]]:
+    terms = [(token, _NAME_WEIGHT) for token in normalize_tokens(profile.name)]
+    if profile.team:
+        team_text = f"{profile.team} {TEAM_NAMES.get(profile.team.upper(), '')}"
+        terms.extend((token, _TEAM_WEIGHT) for token in normalize_tokens(team_text))
+    terms.extend((token, _ROLE_WEIGHT) for token in _ROLE_TERMS)
+    return terms
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Google News dates are parsed without tzinfo but are UTC.
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+class HeadlineRanker:
+    """Scores a whole slate's candidate headlines with TF-IDF relevance and time decay.
+
+    Every (player, headline) pair becomes one row of a sparse term matrix, so
+    relevance for the whole slate is a single batched dot product against the
+    per-player query vectors. Near-duplicate stories are collapsed per player with
+    MinHash signatures over word shingles before the top headlines are kept.
+    """
+
+    def __init__(
+        self,
+        max_headlines: int | None = None,
+        half_life_hours: float | None = None,
+        duplicate_threshold: float = 0.6,
+        now: Optional[datetime] = None,
+    ) -> None:
+        self.max_headlines = max_headlines or config.news.max_headlines
+        self.half_life_hours = half_life_hours or config.news.recency_half_life_hours
+        self.duplicate_threshold = duplicate_threshold
+        self._now = now
+        rng = np.random.default_rng(0x5EED)
+        self._hash_a = rng.integers(1, _MERSENNE_PRIME, _MINHASH_PERMUTATIONS, dtype=np.uint64)
+        self._hash_b = rng.integers(0, _MERSENNE_PRIME, _MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+    def _score(
+        self,
+        owners: np.ndarray,
+        documents: Sequence[List[str]],
+        queries: Sequence[List[Tuple[str, float]]],
+        published: Sequence[Optional[datetime]],
+    ) -> np.ndarray:
+        vocabulary: Dict[str, int] = {}
+        doc_rows: List[int] = []
+        doc_cols: List[int] = []
+        for row, tokens in enumerate(documents):
+            for token in tokens:
+                doc_rows.append(row)
+                doc_cols.append(vocabulary.setdefault(token, len(vocabulary)))
+        n_docs, n_terms = len(documents), max(len(vocabulary), 1)
+        query_keys: Dict[int, float] = {}
+        for row, terms in enumerate(queries):
+            for token, weight in terms:
+                column = vocabulary.get(token)
+                if column is not None:
+                    key = row * n_terms + column
+                    query_keys[key] = max(query_keys.get(key, 0.0), weight)
+
+        # Term matrices are kept in coordinate form (one entry per row/term pair)
+        # so memory grows with the text, not with rows x vocabulary.
+        doc_keys, tf = np.unique(
+            np.asarray(doc_rows, dtype=np.int64) * n_terms + np.asarray(doc_cols, dtype=np.int64),
+            return_counts=True,
+        )
+        rows, cols = np.divmod(doc_keys, n_terms)
+        df = np.bincount(cols, minlength=n_terms)
+        idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+        doc_weights = np.log1p(tf) * idf[cols]
+        doc_norms = np.sqrt(np.bincount(rows, doc_weights**2, minlength=n_docs))
+
+        q_keys = np.fromiter(query_keys.keys(), dtype=np.int64, count=len(query_keys))
+        order = np.argsort(q_keys)
+        q_keys = q_keys[order]
+        q_rows, q_cols = np.divmod(q_keys, n_terms)
+        q_weights = np.fromiter(query_keys.values(), dtype=np.float64, count=len(query_keys))[order]
+        q_weights *= idf[q_cols]
+        q_norms = np.sqrt(np.bincount(q_rows, q_weights**2, minlength=len(queries)))
+
+        # Look up each document term in its owner's query vector in one batch.
+        relevance = np.zeros(n_docs, dtype=np.float64)
+        if len(q_keys):
+            lookup = owners[rows] * n_terms + cols
+            slot = np.minimum(np.searchsorted(q_keys, lookup), len(q_keys) - 1)
+            products = np.where(q_keys[slot] == lookup, doc_weights * q_weights[slot], 0.0)
+            dots = np.bincount(rows, products, minlength=n_docs)
+            relevance = dots / np.maximum(doc_norms * q_norms[owners], 1e-9)
+
+        now = _as_utc(self._now or datetime.now(timezone.utc))
+        age_hours = np.array(
+            [
+                (now - _as_utc(value)).total_seconds() / 3600.0 if value else np.nan
+                for value in published
+            ],
+            dtype=np.float64,
+        )
+        recency = np.where(
+            np.isnan(age_hours),
+            _UNDATED_RECENCY,
+            np.exp2(-np.clip(age_hours, 0.0, None) / self.half_life_hours),
+        )
+        return _RELEVANCE_WEIGHT * relevance + _RECENCY_WEIGHT * recency
+
+    def _signature(self, tokens: List[str]) -> np.ndarray:
+        if len(tokens) < _SHINGLE_SIZE:
+            shingles = [" ".join(tokens)]
+        else:
+            shingles = [
+                " ".join(tokens[i : i + _SHINGLE_SIZE]) for i in range(len(tokens) - _SHINGLE_SIZE + 1)
+            ]
+        hashes = np.array([zlib.crc32(s.encode()) for s in shingles], dtype=np.uint64)
+        permuted = (hashes[:, None] * self._hash_a + self._hash_b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def _select(self, order: np.ndarray, signatures: np.ndarray) -> List[int]:
+        kept: List[int] = []
+        for index in order:
+            if kept:
+                similarity = (signatures[kept] == signatures[index]).mean(axis=1)
+                if similarity.max() >= self.duplicate_threshold:
+                    continue
+            kept.append(int(index))
+            if len(kept) >= self.max_headlines:
+                break
+        return kept
+
+    def rank(
+        self, profiles: Sequence[PlayerProfile], candidates: Dict[str, List[NewsItem]]
+    ) -> Dict[str, List[NewsItem]]:
+        """Return each player's best ``max_headlines`` distinct headlines, best first."""
+        owners: List[int] = []
+        items: List[NewsItem] = []
+        for position, profile in enumerate(profiles):
+            for item in candidates.get(profile.player_id, []):
+                owners.append(position)
+                items.append(item)
+        if not items:
+            return {profile.player_id: [] for profile in profiles}
+
+        documents = [_document_tokens(item) for item in items]
+        # Titles alone decide duplicates: summaries differ in length across sources.
+        signatures = np.stack([self._signature(normalize_tokens(item.title)) for item in items])
+        owner_array = np.asarray(owners, dtype=np.intp)
+        scores = self._score(
+            owner_array,
+            documents,
+            [_query_terms(profile) for profile in profiles],
+            [item.published for item in items],
+        )
+
+        ranked: Dict[str, List[NewsItem]] = {}
+        for position, profile in enumerate(profiles):
+            rows = np.flatnonzero(owner_array == position)
+            order = rows[np.argsort(-scores[rows], kind="stable")]
+            ranked[profile.player_id] = [items[i] for i in self._select(order, signatures)]
+        logger.debug("Ranked %s candidate headlines for %s players", len(items), len(profiles))
+        return ranked
@@ -9,6 +9,8 @@ import requests
 
 from codex_fantasy_blogger.config import config
 from codex_fantasy_blogger.models import PlayerProfile, PlayerTrend
+from codex_fantasy_blogger.services.name_index import PlayerNameIndex
+from codex_fantasy_blogger.utils.deadline import RunBudget
 from codex_fantasy_blogger.utils.logging import get_logger
 
 
@@ -16,12 +18,16 @@ logger = get_logger("sleeper")
 
 
 class SleeperClient:
-    def __init__(self, session: Optional[requests.Session] = None) -> None:
+    def __init__(
+        self, session: Optional[requests.Session] = None, budget: RunBudget | None = None
+    ) -> None:
         self.session = session or requests.Session()
+        self.budget = budget or RunBudget()
 
     def _get(self, path: str, **params) -> dict:
         url = f"{config.sleeper.base_url}{path}"
-        resp = self.session.get(url, params=params, timeout=10)
+        timeout = self.budget.timeout(config.deadline.http_timeout)
+        resp = self.session.get(url, params=params, timeout=timeout)
         resp.raise_for_status()
         return resp.json()
 
@@ -44,6 +50,11 @@ class SleeperClient:
         logger.info("Loaded %s player entries", len(directory))
         return directory
 
+    @lru_cache(maxsize=1)
+    def get_name_index(self) -> PlayerNameIndex:
+        """Name-matching automaton over the directory, cached alongside it."""
+        return PlayerNameIndex.from_directory(self.get_player_directory())
+
     def _sanitize_profile(self, player_id: str, trend: PlayerTrend) -> Optional[PlayerProfile]:
         directory = self.get_player_directory()
         record = directory.get(player_id)
@@ -0,0 +1,274 @@
+"""Append-only columnar history of Sleeper trending-add snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.models import PlayerTrend
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("trend_store")
+
+# One fixed-width little-endian file per column; row i of every file is one observation.
+_COLUMNS = {
+    "player": np.dtype("<u4"),
+    "count": np.dtype("<u4"),
+    "timestamp": np.dtype("<i8"),
+    "season": np.dtype("<u1"),
+}
+# Sort/search key is player_code * _KEY_SPAN + timestamp (unix seconds fit well below 2**40).
+_KEY_SPAN = np.int64(1 << 40)
+
+WINDOWS = {
+    "6h": timedelta(hours=6),
+    "24h": timedelta(hours=24),
+    "wow": timedelta(days=7),
+}
+RANK_METRICS = ("count", "velocity", "acceleration")
+# A window's comparison snapshot may be at most this share of the window older than its target.
+_WINDOW_TOLERANCE = 0.5
+
+
+@dataclass
+class TrendWindows:
+    """Per-player trending counts and windowed deltas as aligned arrays.
+
+    Deltas are NaN when the store has no snapshot old enough to compare against or
+    the player is absent from the latest one; see ``TrendStore.windows``.
+    """
+
+    player_ids: List[str]
+    current: np.ndarray
+    delta_6h: np.ndarray
+    delta_24h: np.ndarray
+    delta_wow: np.ndarray
+    acceleration_24h: np.ndarray
+
+    def metric(self, name: str) -> np.ndarray:
+        if name == "count":
+            return self.current
+        if name == "velocity":
+            return self.delta_24h
+        if name == "acceleration":
+            return self.acceleration_24h
+        raise ValueError(f"Unknown trend metric '{name}' (expected one of {RANK_METRICS})")
+
+
+class TrendStore:
+    """Stores every trending snapshot as (player, count, timestamp, season) rows.
+
+    Columns live in raw binary files that are appended to and read back through
+    ``np.memmap``. Rows are grouped per player through an offset index (CSR-style
+    ``order``/``offsets`` arrays) built lazily on first query after a write.
+    """
+
+    def __init__(self, root: str | Path | None = None) -> None:
+        self.root = Path(root or config.history.trend_store_dir)
+        self._meta_path = self.root / "meta.json"
+        self._player_ids: List[str] = []
+        self._season_types: List[str] = []
+        self._load_meta()
+        self._player_codes = {player_id: code for code, player_id in enumerate(self._player_ids)}
+        self._cache: Optional[Dict[str, np.ndarray]] = None
+
+    def _load_meta(self) -> None:
+        if not self._meta_path.exists():
+            return
+        try:
+            meta = json.loads(self._meta_path.read_text())
+            self._player_ids = list(meta.get("player_ids", []))
+            self._season_types = list(meta.get("season_types", []))
+        except json.JSONDecodeError:
+            logger.warning("Failed to parse trend store metadata; starting fresh")
+
+    def _save_meta(self) -> None:
+        payload = {"player_ids": self._player_ids, "season_types": self._season_types}
+        tmp_path = self._meta_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload))
+        tmp_path.replace(self._meta_path)
+
+    def _column_path(self, name: str) -> Path:
+        return self.root / f"{name}.bin"
+
+    def _code_for(self, player_id: str) -> int:
+        code = self._player_codes.get(player_id)
+        if code is None:
+            code = len(self._player_ids)
+            self._player_ids.append(player_id)
+            self._player_codes[player_id] = code
+        return code
+
+    def append(
+        self,
+        trends: Iterable[PlayerTrend],
+        season_type: str | None = None,
+        observed_at: datetime | None = None,
+    ) -> int:
+        """Append one snapshot; returns the number of rows written."""
+        season_type = season_type or config.sleeper.season_type
+        observed_at = observed_at or datetime.now(timezone.utc)
+        if observed_at.tzinfo is None:
+            observed_at = observed_at.replace(tzinfo=timezone.utc)
+        if season_type not in self._season_types:
+            self._season_types.append(season_type)
+        trends = list(trends)
+        if not trends:
+            return 0
+        columns = {
+            "player": np.array([self._code_for(trend.player_id) for trend in trends]),
+            "count": np.array([trend.count for trend in trends]),
+            "timestamp": np.full(len(trends), int(observed_at.timestamp())),
+            "season": np.full(len(trends), self._season_types.index(season_type)),
+        }
+        # Metadata first: a crash after it leaves unused ids, never rows with unknown ids.
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._save_meta()
+        for name, dtype in _COLUMNS.items():
+            with self._column_path(name).open("ab") as handle:
+                columns[name].astype(dtype).tofile(handle)
+        self._cache = None
+        logger.info("Recorded %s trending rows at %s", len(trends), observed_at.isoformat())
+        return len(trends)
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        if self._cache is not None:
+            return self._cache
+        raw: Dict[str, np.ndarray] = {}
+        for name, dtype in _COLUMNS.items():
+            path = self._column_path(name)
+            size = path.stat().st_size // dtype.itemsize if path.exists() else 0
+            if size:
+                raw[name] = np.memmap(path, dtype=dtype, mode="r", shape=(size,))
+            else:
+                raw[name] = np.empty(0, dtype=dtype)
+        # A write interrupted mid-append can leave columns of unequal length.
+        rows = min(len(column) for column in raw.values())
+        keys = raw["player"][:rows].astype(np.int64) * _KEY_SPAN + raw["timestamp"][:rows]
+        order = np.argsort(keys, kind="stable")
+        sorted_players = raw["player"][:rows][order]
+        self._cache = {
+            **{name: column[:rows] for name, column in raw.items()},
+            "order": order,
+            "keys": keys[order],
+            "offsets": np.searchsorted(sorted_players, np.arange(len(self._player_ids) + 1)),
+        }
+        return self._cache
+
+    def __len__(self) -> int:
+        return len(self._columns()["count"])
+
+    def player_history(self, player_id: str) -> np.ndarray:
+        """Return ``(timestamp, count)`` rows for one player, oldest first."""
+        code = self._player_codes.get(player_id)
+        if code is None:
+            return np.empty((0, 2), dtype=np.int64)
+        cols = self._columns()
+        rows = cols["order"][cols["offsets"][code] : cols["offsets"][code + 1]]
+        return np.column_stack([cols["timestamp"][rows], cols["count"][rows]]).astype(np.int64)
+
+    def _values_at(
+        self,
+        cols: Dict[str, np.ndarray],
+        snapshots: np.ndarray,
+        floors: np.ndarray,
+        codes: np.ndarray,
+        when: int,
+        max_age: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Count for every code in the latest snapshot at or before ``when``.
+
+        Sleeper only returns the top trending players, so a player absent from a
+        snapshot had at most that snapshot's lowest recorded count, not 0. Absent
+        players get that floor as an upper bound and are flagged in the returned
+        mask. Every count is NaN when there is no snapshot that old, or when the
+        nearest one is more than ``max_age`` seconds before ``when``, so a sparse
+        history never passes a weekly gap off as a 24h change.
+        """
+        position = np.searchsorted(snapshots, when, side="right") - 1
+        if position < 0 or (max_age is not None and when - snapshots[position] > max_age):
+            return np.full(len(codes), np.nan), np.zeros(len(codes), dtype=bool)
+        lookup = codes.astype(np.int64) * _KEY_SPAN + snapshots[position]
+        keys = cols["keys"]
+        slot = np.minimum(np.searchsorted(keys, lookup), len(keys) - 1)
+        counts = cols["count"][cols["order"][slot]].astype(np.float64)
+        missing = keys[slot] != lookup
+        return np.where(missing, floors[position], counts), missing
+
+    def windows(self, now: datetime | None = None, season_type: str | None = None) -> TrendWindows:
+        """Compute 6h/24h/week-over-week deltas and 24h acceleration for every known player.
+
+        Windows are anchored at the latest snapshot taken at or before ``now``. A
+        window is NaN unless a snapshot lies within half its span before the
+        window start. Players missing from the anchor snapshot get NaN. A player missing from
+        an older snapshot is compared against that snapshot's floor, so its delta
+        is a lower bound. Acceleration is NaN when the two-day-old count is only
+        bounded, since an upper bound there would overstate it.
+        """
+        cols = self._columns()
+        timestamps, counts = cols["timestamp"], cols["count"]
+        if season_type is not None:
+            code = self._season_types.index(season_type) if season_type in self._season_types else -1
+            in_season = cols["season"] == code
+            timestamps, counts = timestamps[in_season], counts[in_season]
+        snapshots, snapshot_of_row = np.unique(timestamps, return_inverse=True)
+        # Lowest count recorded in each snapshot: the cutoff of Sleeper's top-N list.
+        floors = np.full(len(snapshots), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(floors, snapshot_of_row, counts.astype(np.int64))
+        floors = floors.astype(np.float64)
+        codes = np.arange(len(self._player_ids))
+        now = now or datetime.now(timezone.utc)
+        latest = np.searchsorted(snapshots, int(now.timestamp()), side="right") - 1
+        anchor = int(snapshots[latest]) if latest >= 0 else int(now.timestamp())
+
+        current, absent = self._values_at(cols, snapshots, floors, codes, anchor)
+        current = np.where(absent, np.nan, current)
+        past = {}
+        for label, span in WINDOWS.items():
+            seconds = int(span.total_seconds())
+            past[label], _ = self._values_at(
+                cols, snapshots, floors, codes, anchor - seconds, int(seconds * _WINDOW_TOLERANCE)
+            )
+        day = int(WINDOWS["24h"].total_seconds())
+        two_days_ago, bounded = self._values_at(
+            cols, snapshots, floors, codes, anchor - 2 * day, int(day * _WINDOW_TOLERANCE)
+        )
+        delta_24h = current - past["24h"]
+        acceleration = delta_24h - (past["24h"] - two_days_ago)
+        return TrendWindows(
+            player_ids=list(self._player_ids),
+            current=current,
+            delta_6h=current - past["6h"],
+            delta_24h=delta_24h,
+            delta_wow=current - past["wow"],
+            acceleration_24h=np.where(bounded, np.nan, acceleration),
+        )
+
+    def rank(
+        self,
+        trends: List[PlayerTrend],
+        metric: str,
+        now: datetime | None = None,
+        season_type: str | None = None,
+    ) -> List[PlayerTrend]:
+        """Order ``trends`` by ``metric`` (desc), keeping raw count order for ties or gaps."""
+        if metric == "count" or not trends:
+            return list(trends)
+        stats = self.windows(now=now, season_type=season_type)
+        values = stats.metric(metric)
+        by_player = dict(zip(stats.player_ids, values))
+        scores = np.array([by_player.get(trend.player_id, np.nan) for trend in trends])
+        if np.isnan(scores).all():
+            logger.info("Not enough trend history to rank by %s; using raw counts", metric)
+            return list(trends)
+        scores = np.where(np.isnan(scores), -np.inf, scores)
+        counts = np.array([trend.count for trend in trends])
+        order = np.lexsort((-counts, -scores))
+        return [trends[index] for index in order]
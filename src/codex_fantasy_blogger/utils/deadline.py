@@ -0,0 +1,147 @@
+"""Whole-run time budget shared by every network and LLM call."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from codex_fantasy_blogger.config import config
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("deadline")
+
+SKIP_GOOGLE_NEWS = "skip_google_news"
+HEURISTIC_LLM = "heuristic_llm"
+CACHED_HEADLINES = "cached_headlines"
+
+
+_DURATION = re.compile(r"^(\d+(?:\.\d+)?)\s*([smh]?)$")
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600}
+
+
+def parse_deadline(text: str, now: datetime | None = None) -> float:
+    """Seconds of budget for a ``--deadline`` value.
+
+    Accepts a duration (``900``, ``90s``, ``15m``, ``1.5h``) or a local clock time
+    (``HH:MM``) later today.
+    """
+    text = text.strip().lower()
+    match = _DURATION.match(text)
+    if match:
+        seconds = float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    else:
+        now = now or datetime.now()
+        try:
+            clock = datetime.strptime(text, "%H:%M").time()
+        except ValueError:
+            raise ValueError(f"Unrecognized deadline '{text}' (use e.g. 900, 15m, 1h or HH:MM)") from None
+        target = datetime.combine(now.date(), clock)
+        if target <= now:
+            raise ValueError(f"Deadline {text} has already passed today")
+        seconds = (target - now) / timedelta(seconds=1)
+    if seconds <= 0:
+        raise ValueError("Deadline must leave a positive time budget")
+    return seconds
+
+
+def _degradation_steps() -> List[tuple[str, float]]:
+    """Degradations in the order they kick in, with the remaining-budget fraction that triggers each."""
+    return [
+        (SKIP_GOOGLE_NEWS, config.deadline.skip_google_news_below),
+        (HEURISTIC_LLM, config.deadline.heuristic_llm_below),
+        (CACHED_HEADLINES, config.deadline.cached_headlines_below),
+    ]
+
+
+class RunBudget:
+    """Tracks time left before a run must publish and which degradations are active.
+
+    The deadline is stored as wall-clock time so copies shipped to process-pool
+    workers agree with the parent. Workers honour the degradations active when
+    their copy was made and re-check on each call. Steps a worker applies on its
+    own are recorded once the parent next calls ``check()``. Without ``seconds``
+    the budget is unlimited: timeouts keep their defaults and nothing degrades.
+    """
+
+    def __init__(self, seconds: float | None = None) -> None:
+        self.seconds = seconds
+        self.started_at = time.time()
+        self.deadline_at = self.started_at + seconds if seconds is not None else None
+        self.degradations: List[Dict[str, Any]] = []
+        # Pipeline stage in progress, set by the orchestrator; recorded with each degradation.
+        self.current_stage: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def limited(self) -> bool:
+        return self.deadline_at is not None
+
+    def remaining(self) -> float:
+        if self.deadline_at is None:
+            return float("inf")
+        return max(0.0, self.deadline_at - time.time())
+
+    def elapsed(self) -> float:
+        return time.time() - self.started_at
+
+    def timeout(self, default: float) -> float:
+        """Per-call timeout: ``default`` capped at the remaining budget, never below the floor."""
+        return min(default, max(config.deadline.min_timeout, self.remaining()))
+
+    def is_degraded(self, step: str) -> bool:
+        return any(entry["step"] == step for entry in self.degradations)
+
+    def check(self, stage: str | None = None) -> List[str]:
+        """Apply every degradation now due; returns the steps newly applied.
+
+        ``stage`` defaults to ``current_stage``.
+        """
+        if self.seconds is None:
+            return []
+        stage = stage or self.current_stage
+        fraction = self.remaining() / self.seconds if self.seconds > 0 else 0.0
+        applied = []
+        with self._lock:
+            for step, threshold in _degradation_steps():
+                if fraction >= threshold or self.is_degraded(step):
+                    continue
+                self.degradations.append(
+                    {
+                        "step": step,
+                        "stage": stage,
+                        "elapsed_seconds": round(self.elapsed(), 2),
+                        "remaining_seconds": round(self.remaining(), 2),
+                    }
+                )
+                applied.append(step)
+        for step in applied:
+            logger.warning(
+                "Run budget %.0f%% left (%.1fs)%s; degrading: %s",
+                fraction * 100,
+                self.remaining(),
+                f" during {stage}" if stage else "",
+                step,
+            )
+        return applied
+
+    def report(self, output_path: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "budget_seconds": self.seconds,
+            "elapsed_seconds": round(self.elapsed(), 2),
+            "met_deadline": self.remaining() > 0 if self.limited else True,
+            "degradations": self.degradations,
+            "output_path": output_path,
+        }
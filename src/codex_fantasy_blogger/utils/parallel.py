@@ -0,0 +1,91 @@
+"""Sharded execution helpers for agents that fan out over a player slate."""
+
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence, TypeVar
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+EXECUTOR_KINDS = ("process", "thread")
+
+# Several shards per worker keeps the pool busy when one shard hits a slow upstream.
+_SHARDS_PER_WORKER = 4
+
+_local = threading.local()
+
+
+def worker_resource(factory: Callable[[], T]) -> T:
+    """Return this worker's instance of ``factory()``, creating it on first use.
+
+    State is per thread, so each pool worker (thread or process) holds its own
+    HTTP sessions and clients instead of sharing the parent's.
+    """
+    resources: Dict[Any, Any] = getattr(_local, "resources", None)
+    if resources is None:
+        resources = _local.resources = {}
+    if factory not in resources:
+        resources[factory] = factory()
+    return resources[factory]
+
+
+def _init_process_worker() -> None:
+    """Forked workers inherit the parent's tracemalloc session; profiling only covers the parent."""
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def shard(items: Sequence[T], count: int) -> List[List[T]]:
+    """Split ``items`` into ``count`` contiguous, near-equal shards (order preserved)."""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    shards: List[List[T]] = []
+    start = 0
+    for index in range(count):
+        end = start + size + (1 if index < extra else 0)
+        shards.append(list(items[start:end]))
+        start = end
+    return shards
+
+
+class ShardedExecutor:
+    """Runs shard functions across a worker pool and merges results in input order."""
+
+    def __init__(self, workers: int, kind: str = "process") -> None:
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"Unknown executor kind '{kind}' (expected one of {EXECUTOR_KINDS})")
+        self.workers = max(1, workers)
+        self.kind = kind
+        self._pool: Executor | None = None
+
+    def __enter__(self) -> "ShardedExecutor":
+        if self.kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_process_worker
+            )
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def map(self, fn: Callable[[List[T]], List[R]], items: Sequence[T]) -> List[R]:
+        """Apply ``fn`` to each shard of ``items`` and flatten the per-shard results."""
+        if self._pool is None:
+            raise RuntimeError("ShardedExecutor must be used as a context manager")
+        if not items:
+            return []
+        shards = shard(items, self.workers * _SHARDS_PER_WORKER)
+        merged: List[R] = []
+        for shard_items, results in zip(shards, self._pool.map(fn, shards)):
+            if len(results) != len(shard_items):
+                raise RuntimeError("Shard worker returned a mismatched number of results")
+            merged.extend(results)
+        return merged
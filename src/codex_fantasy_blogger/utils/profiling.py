@@ -0,0 +1,157 @@
+"""Opt-in per-stage CPU and memory profiling."""
+
+from __future__ import annotations
+
+import contextlib
+import cProfile
+from datetime import datetime
+import json
+from pathlib import Path
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from codex_fantasy_blogger.utils.logging import get_logger
+
+
+logger = get_logger("profiling")
+
+_TOP_ALLOCATIONS = 25
+_TOP_FUNCTIONS = 30
+
+
+def peak_rss_bytes(who: str = "self") -> Optional[int]:
+    """Peak resident set size so far, if the platform reports it.
+
+    ``who="children"`` gives the largest peak among finished child processes
+    (pool workers once their pool has shut down).
+    """
+    if resource is None:
+        return None
+    target = resource.RUSAGE_CHILDREN if who == "children" else resource.RUSAGE_SELF
+    peak = resource.getrusage(target).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _increase(before: Optional[int], after: Optional[int]) -> Optional[int]:
+    if before is None or after is None:
+        return None
+    return after - before
+
+
+class StageProfiler:
+    """Wraps pipeline stages with cProfile and tracemalloc when given a run directory.
+
+    Each stage writes ``NN-<stage>.pstats``, ``NN-<stage>.txt`` (top functions by
+    cumulative time) and ``NN-<stage>-allocations.txt`` (top allocation sites);
+    ``close()`` writes ``summary.json`` with wall/CPU time, traced peak memory and
+    how much each stage raised the process's peak RSS; the absolute peak RSS of
+    the parent and of the largest child is reported once for the run, since
+    ``ru_maxrss`` is a high-water mark and cannot be split by stage. Without a
+    directory ``stage()`` is a bare ``nullcontext``. Work done inside
+    process-pool workers is not captured: workers stop the tracemalloc session
+    they inherit, and cProfile only sees the parent.
+    """
+
+    def __init__(self, run_dir: str | Path | None = None) -> None:
+        self.run_dir = Path(run_dir) if run_dir is not None else None
+        self.stages: List[Dict[str, Any]] = []
+        self._started_tracing = False
+
+    @classmethod
+    def for_new_run(cls, root: str | Path) -> "StageProfiler":
+        """Create a profiler writing to a fresh timestamped directory under ``root``."""
+        return cls(Path(root) / datetime.utcnow().strftime("run-%Y%m%dT%H%M%S"))
+
+    @property
+    def enabled(self) -> bool:
+        return self.run_dir is not None
+
+    def stage(self, name: str) -> contextlib.AbstractContextManager:
+        if self.run_dir is None:
+            return contextlib.nullcontext()
+        return self._profile_stage(name, self.run_dir)
+
+    @contextlib.contextmanager
+    def _profile_stage(self, name: str, run_dir: Path) -> Iterator[None]:
+        run_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        rss_before = peak_rss_bytes()
+        profiler = cProfile.Profile()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+            _, traced_peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            prefix = run_dir / f"{len(self.stages) + 1:02d}-{name}"
+            self._write_stage(prefix, name, profiler, before, after)
+            self.stages.append(
+                {
+                    "stage": name,
+                    "wall_seconds": round(wall, 4),
+                    "cpu_seconds": round(cpu, 4),
+                    "traced_peak_bytes": traced_peak,
+                    "peak_rss_increase_bytes": _increase(rss_before, peak_rss_bytes()),
+                }
+            )
+            logger.info(
+                "Stage %s: %.2fs wall, %.2fs CPU, %.1f MiB traced peak",
+                name,
+                wall,
+                cpu,
+                traced_peak / 2**20,
+            )
+
+    def _write_stage(
+        self,
+        prefix: Path,
+        name: str,
+        profiler: cProfile.Profile,
+        before: tracemalloc.Snapshot,
+        after: tracemalloc.Snapshot,
+    ) -> None:
+        profiler.dump_stats(f"{prefix}.pstats")
+        with open(f"{prefix}.txt", "w") as handle:
+            stats = pstats.Stats(profiler, stream=handle)
+            stats.sort_stats("cumulative").print_stats(_TOP_FUNCTIONS)
+        # Net growth per line over the stage, excluding tracemalloc's own bookkeeping.
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diffs = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+        lines = [f"Top {_TOP_ALLOCATIONS} allocation sites for stage '{name}' (net growth)"]
+        for stat in diffs[:_TOP_ALLOCATIONS]:
+            lines.append(
+                f"{stat.size_diff / 1024:+10.1f} KiB  {stat.count_diff:+8d} blocks  {stat.traceback}"
+            )
+        Path(f"{prefix}-allocations.txt").write_text("\n".join(lines) + "\n")
+
+    def close(self) -> Optional[Path]:
+        """Stop tracing and write the run summary; returns its path when enabled."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if self.run_dir is None or not self.stages:
+            return None
+        summary_path = self.run_dir / "summary.json"
+        summary = {
+            "stages": self.stages,
+            "peak_rss_bytes": peak_rss_bytes(),
+            "children_peak_rss_bytes": peak_rss_bytes("children"),
+        }
+        summary_path.write_text(json.dumps(summary, indent=2))
+        return summary_path
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from codex_fantasy_blogger.models import PlayerTrend
+from codex_fantasy_blogger.services.trend_store import TrendStore
+
+
+START = datetime(2025, 9, 1, tzinfo=timezone.utc)
+
+
+def _snapshot(store, observed_at, counts):
+    trends = [PlayerTrend(player_id=player_id, count=count) for player_id, count in counts.items()]
+    store.append(trends, season_type="regular", observed_at=observed_at)
+
+
+def test_weekly_snapshots_only_fill_week_over_week(tmp_path):
+    store = TrendStore(tmp_path)
+    _snapshot(store, START, {"a": 1000, "b": 500})
+    _snapshot(store, START + timedelta(days=7), {"a": 1100, "b": 4000})
+
+    windows = store.windows(now=START + timedelta(days=7, hours=1), season_type="regular")
+
+    np.testing.assert_array_equal(windows.delta_wow, [100, 3500])
+    assert np.isnan(windows.delta_6h).all()
+    assert np.isnan(windows.delta_24h).all()
+    assert np.isnan(windows.acceleration_24h).all()
+
+
+def test_week_over_week_ignores_much_older_snapshot(tmp_path):
+    store = TrendStore(tmp_path)
+    _snapshot(store, START, {"a": 1000})
+    _snapshot(store, START + timedelta(days=30), {"a": 1500})
+
+    windows = store.windows(now=START + timedelta(days=30), season_type="regular")
+
+    assert np.isnan(windows.delta_wow).all()
+
+
+def test_daily_snapshots_give_distinct_velocity_and_acceleration(tmp_path):
+    store = TrendStore(tmp_path)
+    _snapshot(store, START, {"a": 100, "b": 100})
+    _snapshot(store, START + timedelta(days=1), {"a": 200, "b": 400})
+    _snapshot(store, START + timedelta(days=2), {"a": 300, "b": 500})
+
+    windows = store.windows(now=START + timedelta(days=2), season_type="regular")
+
+    np.testing.assert_array_equal(windows.delta_24h, [100, 100])
+    np.testing.assert_array_equal(windows.acceleration_24h, [0, -200])
+    assert np.isnan(windows.delta_wow).all()